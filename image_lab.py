@@ -1,5 +1,12 @@
-from src.gui.main import ImageLabGUI
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from src.cli import main
+
+        sys.exit(main(sys.argv[2:]))
+
+    from src.gui.main import ImageLabGUI
+
     app = ImageLabGUI()
     app.run()
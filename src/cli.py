@@ -0,0 +1,311 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from glob import glob
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from src.config import OCRConfig, ProcessingConfig
+from src.core.batch import process_batch
+from src.core.ocr import prepare_ocr_image, recognize_text
+from src.core.processing import process_image, profile_image
+from src.infra.cache import configure_disk_cache
+from src.infra.io import load_image, load_json, save_image
+
+IMAGE_SUFFIXES: tuple[str, ...] = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+MANIFEST_NAME: str = "manifest.json"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(argv)
+    data = load_json(args.config)
+
+    if data is None:
+        print(f"Failed to load configuration: {args.config}", file=sys.stderr)
+        return 2
+
+    processing_config = ProcessingConfig()
+    processing_config.update_from_dict(data.get("processing", {}))
+
+    ocr_config: OCRConfig | None = None
+
+    if args.ocr:
+        ocr_config = OCRConfig()
+        ocr_config.update_from_dict(data.get("ocr", {}))
+
+    if args.cache_dir is not None:
+        configure_disk_cache(args.cache_dir, args.cache_max_mb * 1024 * 1024)
+
+    inputs = list(_collect_inputs(args.inputs, args.recursive))
+
+    if not inputs:
+        print("No input images found", file=sys.stderr)
+        return 2
+
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    jobs, conflicts = _assign_outputs(inputs, args.output, args.suffix)
+
+    for record in conflicts:
+        print(f"{record['input']} -> error: {record['error']}", file=sys.stderr)
+
+    if args.workers > 1:
+        results = process_files_parallel(jobs, processing_config, ocr_config, args.workers)
+    else:
+        results = (
+            process_file(path, output, processing_config, ocr_config, args.tile_size, args.profile)
+            for path, output in jobs
+        )
+
+    records = list(conflicts)
+
+    for index, record in enumerate(results, 1):
+        records.append(record)
+        print(f"[{index}/{len(jobs)}] {record['input']} -> {record['status']} ({record['seconds']:.2f}s)")
+
+    order = {str(path): index for index, (path, _) in enumerate(inputs)}
+    records.sort(key=lambda record: order[record["input"]])
+
+    failed = sum(record["status"] != "ok" for record in records)
+    manifest_path = args.output / MANIFEST_NAME
+
+    write_manifest(manifest_path, args.config, records)
+    print(f"Processed {len(records) - failed}/{len(records)} images, manifest written to {manifest_path}")
+
+    return 1 if failed else 0
+
+
+def process_file(
+    path: Path,
+    output: Path,
+    processing_config: ProcessingConfig,
+    ocr_config: OCRConfig | None = None,
+    tile_size: int | None = None,
+    profile: bool = False,
+) -> dict[str, Any]:
+    record = _create_record(path)
+    start = time.perf_counter()
+
+    try:
+        image = load_image(str(path))
+
+        if image is None:
+            raise RuntimeError("Failed to load image")
+
+        if profile:
+            processed, processing_profile = profile_image(image, processing_config, trace_memory=True)
+            record["profile"] = processing_profile.to_dict()
+        else:
+            processed = process_image(image, processing_config, tile_size)
+
+        _finish_record(record, processed, output, ocr_config)
+
+    except Exception as exception:
+        _fail_record(record, exception)
+
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def process_files_parallel(
+    jobs: Sequence[tuple[Path, Path]],
+    processing_config: ProcessingConfig,
+    ocr_config: OCRConfig | None = None,
+    workers: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    ready: list[dict[str, Any]] = []
+
+    def load_images() -> Iterable[tuple[tuple[Path, Path, str], np.ndarray]]:
+        for path, output in jobs:
+            start = time.perf_counter()
+            image = load_image(str(path))
+
+            if image is None:
+                ready.append(_fail_record(_create_record(path), RuntimeError("Failed to load image")))
+                continue
+
+            # Images already processed in an earlier run are finished here instead of going to the workers
+            cache_key = process_image.cache_key(image, processing_config, None)
+            processed = process_image.lookup(cache_key)
+
+            if processed is None:
+                yield (path, output, cache_key), image
+                continue
+
+            record = _create_record(path)
+
+            try:
+                _finish_record(record, processed, output, ocr_config)
+
+            except Exception as exception:
+                _fail_record(record, exception)
+
+            record["seconds"] = time.perf_counter() - start
+            ready.append(record)
+
+    for result in process_batch(load_images(), processing_config, workers):
+        yield from _drain(ready)
+
+        path, output, cache_key = result.key
+        record = _create_record(path)
+        start = time.perf_counter()
+
+        try:
+            if result.error is not None:
+                raise result.error
+
+            processed = process_image.store(cache_key, result.image)
+            _finish_record(record, processed, output, ocr_config)
+
+        except Exception as exception:
+            _fail_record(record, exception)
+
+        record["seconds"] = result.seconds + time.perf_counter() - start
+        yield record
+
+    yield from _drain(ready)
+
+
+def write_manifest(filename: Path, config_filename: str, records: list[dict[str, Any]]) -> None:
+    manifest = {
+        "config": config_filename,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": records,
+    }
+    filename.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def _drain(records: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    while records:
+        yield records.pop(0)
+
+
+def _create_record(path: Path) -> dict[str, Any]:
+    return {"input": str(path), "output": None, "status": "ok", "error": None, "seconds": 0.0}
+
+
+def _finish_record(record: dict[str, Any], processed: np.ndarray, output: Path, ocr_config: OCRConfig | None) -> None:
+    if not save_image(processed, str(output)):
+        raise RuntimeError(f"Failed to save image to {output}")
+
+    record["output"] = str(output)
+
+    if ocr_config is not None:
+        record["ocr"] = _run_ocr(processed, ocr_config)
+
+
+def _fail_record(record: dict[str, Any], exception: Exception) -> dict[str, Any]:
+    record["status"] = "error"
+    record["error"] = str(exception)
+    return record
+
+
+def _run_ocr(image: np.ndarray, ocr_config: OCRConfig) -> dict[str, list]:
+    return recognize_text(prepare_ocr_image(image), ocr_config).to_dict()
+
+
+def _assign_outputs(
+    inputs: Sequence[tuple[Path, Path]],
+    output_dir: Path,
+    suffix: str,
+) -> tuple[list[tuple[Path, Path]], list[dict[str, Any]]]:
+    targets = [(output_dir / relative).with_suffix(suffix) for _, relative in inputs]
+    groups: dict[Path, list[Path]] = {}
+
+    for (path, _), target in zip(inputs, targets, strict=True):
+        groups.setdefault(target, []).append(path)
+
+    claimed: dict[Path, Path] = {}
+    jobs = []
+    conflicts = []
+
+    for (path, _), target in zip(inputs, targets, strict=True):
+        if len(groups[target]) > 1:
+            target = _disambiguate_output(path, target, groups[target], suffix)
+
+        if target in claimed:
+            error = RuntimeError(f"Output {target} would overwrite the result of {claimed[target]}")
+            conflicts.append(_fail_record(_create_record(path), error))
+            continue
+
+        claimed[target] = path
+        jobs.append((path, target))
+
+    return jobs, conflicts
+
+
+def _disambiguate_output(path: Path, target: Path, group: Sequence[Path], suffix: str) -> Path:
+    # Inputs from different directories keep the directories that tell them apart,
+    # inputs differing only in suffix keep it in the output name
+    parents = [candidate.resolve().parent for candidate in group]
+
+    try:
+        subdirectory = path.resolve().parent.relative_to(os.path.commonpath(parents))
+    except ValueError:
+        subdirectory = Path()
+
+    name = path.stem
+
+    if len({candidate.suffix.lower() for candidate in group}) > 1:
+        name = f"{name}_{path.suffix.lstrip('.')}"
+
+    return target.parent / subdirectory / f"{name}{suffix}"
+
+
+def _collect_inputs(patterns: Sequence[str], recursive: bool) -> Iterator[tuple[Path, Path]]:
+    seen: set[Path] = set()
+
+    for pattern in patterns:
+        path = Path(pattern)
+
+        if path.is_dir():
+            candidates = path.rglob("*") if recursive else path.glob("*")
+            matches = [(candidate, candidate.relative_to(path)) for candidate in sorted(candidates)]
+        else:
+            matches = [(Path(match), Path(Path(match).name)) for match in sorted(glob(pattern, recursive=recursive))]
+
+        for candidate, relative in matches:
+            resolved = candidate.resolve()
+
+            if candidate.is_file() and candidate.suffix.lower() in IMAGE_SUFFIXES and resolved not in seen:
+                seen.add(resolved)
+                yield candidate, relative
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="image_lab.py batch",
+        description="Apply a saved Image Lab configuration to a set of images",
+    )
+    parser.add_argument("config", help="configuration file saved from Image Lab")
+    parser.add_argument("inputs", nargs="+", help="input image files, directories or glob patterns")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="output directory")
+    parser.add_argument("-r", "--recursive", action="store_true", help="descend into subdirectories and ** globs")
+    parser.add_argument("--suffix", default=".png", help="file suffix of processed images (default: .png)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes for image processing")
+    parser.add_argument("--tile-size", type=int, help="process large images in tiles of this size on all cores")
+    parser.add_argument("--profile", action="store_true", help="record per-operation timing in the manifest")
+    parser.add_argument("--ocr", action="store_true", help="run OCR on processed images and add text to manifest")
+    parser.add_argument("--cache-dir", type=Path, help="persist processing and OCR results in this directory")
+    parser.add_argument("--cache-max-mb", type=int, default=2048, help="disk cache size limit (default: 2048)")
+
+    args = parser.parse_args(argv)
+
+    # Worker processes run the compiled plan whole, so they neither tile nor profile
+    if args.workers > 1 and args.tile_size is not None:
+        parser.error("--tile-size cannot be combined with --workers")
+
+    if args.workers > 1 and args.profile:
+        parser.error("--profile cannot be combined with --workers")
+
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+import hashlib
+from dataclasses import dataclass, field, fields
 from typing import Any, Literal
 
 
@@ -6,12 +7,38 @@ from typing import Any, Literal
 class Config:
     """Base configuration class"""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+        if name != "_fields_digest":
+            object.__setattr__(self, "_fields_digest", None)
+
     def update_from_dict(self, data: dict[str, Any]) -> None:
         """Update config from dictionary"""
         for key, value in data.items():
             if hasattr(self, key):
                 setattr(self, key, value)
 
+    def fingerprint(self) -> str:
+        """Stable digest of all field values, including nested configs"""
+        digest = vars(self).get("_fields_digest")
+
+        if digest is None:
+            values = [(f.name, getattr(self, f.name)) for f in fields(self)]
+            plain = [(name, _normalize(value)) for name, value in values if not isinstance(value, Config)]
+            digest = _digest(f"{type(self).__name__}{plain!r}")
+
+            # Lists and dicts can change in place without passing through __setattr__, so only immutable values are kept
+            if not any(isinstance(value, list | dict | set) for _, value in values):
+                self._fields_digest = digest
+
+        nested = [value.fingerprint() for value in vars(self).values() if isinstance(value, Config)]
+
+        if not nested:
+            return digest
+
+        return _digest(digest + "".join(nested))
+
 
 @dataclass
 class CaptureConfig(Config):
@@ -150,6 +177,10 @@ class EasyOCRConfig(Config):
 class OCRConfig(Config):
     ocr_type: Literal["paddleocr", "tesseract", "easyocr", "rapidocr"] = "paddleocr"
     min_display_confidence_percent: float = 0.0
+    tiled: bool = False
+    tile_size: int = 1280
+    tile_overlap: int = 160
+    regions: list[tuple[int, int, int, int]] = field(default_factory=list)  # [(x1, y1, x2, y2), ...]
     paddleocr_config: PaddleOCRConfig = field(default_factory=PaddleOCRConfig)
     tesseract_config: TesseractConfig = field(default_factory=TesseractConfig)
     easyocr_config: EasyOCRConfig = field(default_factory=EasyOCRConfig)
@@ -199,6 +230,7 @@ class ProcessingConfig(Config):
     edge_sigma_s: float = 50.0
     edge_sigma_r: float = 0.4
     noise_reduction_bilateral: bool = False
+    noise_reduction_d: int = 5
     bilateral_iterations: int = 1
 
     # Filters
@@ -212,6 +244,7 @@ class ProcessingConfig(Config):
     median_filter: bool = False
     median_kernel: int = 3
     background_subtraction: bool = False
+    bg_kernel_size: int = 20
     bg_threshold: int = 50
 
     # Histogram and contrast
@@ -277,6 +310,7 @@ class ProcessingConfig(Config):
     edge_enhancement: bool = False
     edge_strength: float = 1.0
     unsharp_mask: bool = False
+    unsharp_sigma: float = 2.0
     unsharp_strength: float = 1.5
     sharpen: bool = False
     sharpen_strength: float = 0.2
@@ -307,3 +341,21 @@ class ProcessingConfig(Config):
     local_binary_pattern: bool = False
     lbp_radius: int = 3
     lbp_n_points: int = 24
+
+
+def _normalize(value: Any) -> Any:
+    # Lists and tuples with the same contents describe the same setting, e.g. after a JSON round trip
+    if isinstance(value, list | tuple):
+        return tuple(_normalize(item) for item in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _normalize(item)) for key, item in value.items()))
+
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(map(repr, value)))
+
+    return value
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
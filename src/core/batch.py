@@ -0,0 +1,138 @@
+import os
+import time
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from src.config import ProcessingConfig
+from src.core.processing import ProcessingPlan, compile_plan
+
+SharedArray = tuple[str, tuple[int, ...], str]
+
+_worker_plan: ProcessingPlan | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    key: Hashable
+    image: np.ndarray | None
+    error: Exception | None
+    seconds: float
+
+
+def process_batch(
+    items: Iterable[tuple[Hashable, np.ndarray]],
+    config: ProcessingConfig | None = None,
+    workers: int | None = None,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchResult]:
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    pending: dict[Future, tuple[Hashable, shared_memory.SharedMemory]] = {}
+    items_iter = iter(items)
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(config,)) as executor:
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    item = next(items_iter, None)
+
+                    if item is None:
+                        break
+
+                    key, image = item
+                    block, shared = _to_shared_memory(image)
+                    pending[executor.submit(_process_shared, shared)] = (key, block)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    key, block = pending.pop(future)
+                    _release(block)
+                    yield _collect_result(key, future)
+
+        finally:
+            for future, (_, block) in pending.items():
+                _release(block)
+
+                if not future.cancel():
+                    _discard_result(future)
+
+
+def _init_worker(config: ProcessingConfig | None) -> None:
+    global _worker_plan
+    _worker_plan = compile_plan(config)
+
+    # One OpenCV thread per worker keeps the pool from oversubscribing cores
+    cv2.setNumThreads(1)
+
+
+def _process_shared(shared: SharedArray) -> tuple[SharedArray, float]:
+    start = time.perf_counter()
+
+    # The plan copies its input before any stage runs, so the shared block can be read in place
+    block = shared_memory.SharedMemory(name=shared[0])
+
+    try:
+        processed = _worker_plan.run(_from_shared_memory(block, shared))
+
+    finally:
+        block.close()
+
+    output_block, output_shared = _to_shared_memory(processed)
+    output_block.close()
+
+    return output_shared, time.perf_counter() - start
+
+
+def _collect_result(key: Hashable, future: Future) -> BatchResult:
+    try:
+        shared, seconds = future.result()
+
+    except Exception as exception:
+        return BatchResult(key, None, exception, 0.0)
+
+    block = shared_memory.SharedMemory(name=shared[0])
+
+    try:
+        image = _from_shared_memory(block, shared).copy()
+
+    finally:
+        _release(block)
+
+    return BatchResult(key, image, None, seconds)
+
+
+def _discard_result(future: Future) -> None:
+    try:
+        shared, _ = future.result()
+        _release(shared_memory.SharedMemory(name=shared[0]))
+
+    except Exception:
+        pass
+
+
+def _to_shared_memory(image: np.ndarray) -> tuple[shared_memory.SharedMemory, SharedArray]:
+    image = np.ascontiguousarray(image)
+    block = shared_memory.SharedMemory(create=True, size=max(1, image.nbytes))
+    np.ndarray(image.shape, image.dtype, buffer=block.buf)[...] = image
+
+    return block, (block.name, image.shape, image.dtype.str)
+
+
+def _from_shared_memory(block: shared_memory.SharedMemory, shared: SharedArray) -> np.ndarray:
+    _, shape, dtype = shared
+    return np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+
+
+def _release(block: shared_memory.SharedMemory) -> None:
+    block.close()
+    block.unlink()
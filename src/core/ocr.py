@@ -1,22 +1,60 @@
+import difflib
+import functools
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import Any, Protocol
 
 import cv2
-import easyocr
 import numpy as np
-import pytesseract
-from paddleocr import PaddleOCR
-from rapidocr import LangDet, LangRec, ModelType, OCRVersion, RapidOCR
 
-from src.config import EasyOCRConfig, OCRConfig, PaddleOCRConfig, RapidOCRConfig, TesseractConfig
+from src.config import Config, EasyOCRConfig, OCRConfig, PaddleOCRConfig, RapidOCRConfig, TesseractConfig
+from src.core.ocr_result import OCRResult
 from src.infra.cache import ocr_cache
 
+OCR_ENGINE_POOL_MAX_ENGINES: int = 4
+OCR_ENGINE_POOL_MAX_BYTES: int = 4 * 1024 * 1024 * 1024
+OCR_ENGINE_IDLE_SECONDS: float = 600.0
+OCR_RESULT_CACHE_SIZE: int = 128
+OCR_RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+OCR_TILE_IOU_THRESHOLD: float = 0.5
+OCR_TILE_CONTAINMENT_THRESHOLD: float = 0.8
+OCR_TILE_TEXT_SIMILARITY: float = 0.8
+
 
 class OCRProtocol(Protocol):
-    def predict(self, image: np.ndarray) -> Any: ...
+    # Settings applied by configure() to an existing instance; any other setting requires a new instance
+    INFERENCE_FIELDS: tuple[str, ...]
+
+    def __init__(self, config: Any) -> None: ...
+
+    def configure(self, config: Any) -> None: ...
+
+    def predict(self, image: np.ndarray) -> OCRResult: ...
+
+    def predict_batch(self, images: Sequence[np.ndarray]) -> list[OCRResult]: ...
 
 
 class PaddleOCRWrapper:
+    INFERENCE_FIELDS: tuple[str, ...] = (
+        "text_det_limit_side_len",
+        "text_det_limit_type",
+        "text_det_thresh",
+        "text_det_box_thresh",
+        "text_det_unclip_ratio",
+        "text_rec_score_thresh",
+    )
+
     def __init__(self, config: PaddleOCRConfig) -> None:
+        from paddleocr import PaddleOCR
+
         self._ocr = PaddleOCR(
             ocr_version=config.ocr_version,
             lang=config.lang,
@@ -51,23 +89,49 @@ class PaddleOCRWrapper:
             use_tensorrt=config.use_tensorrt,
             precision=config.precision,
         )
+        self.configure(config)
+
+    def configure(self, config: PaddleOCRConfig) -> None:
+        self._predict_kwargs = {name: getattr(config, name) for name in self.INFERENCE_FIELDS}
+
+    def predict(self, image: np.ndarray) -> OCRResult:
+        return self._to_result(self._ocr.predict(image, **self._predict_kwargs)[0])
+
+    def predict_batch(self, images: Sequence[np.ndarray]) -> list[OCRResult]:
+        if not images:
+            return []
 
-    def predict(self, image: np.ndarray) -> Any:
-        return self._ocr.predict(image)
+        return [self._to_result(result) for result in self._ocr.predict(list(images), **self._predict_kwargs)]
+
+    @staticmethod
+    def _to_result(result: Any) -> OCRResult:
+        return OCRResult(result["rec_texts"], result["rec_scores"], result["rec_polys"])
 
 
 class TesseractOCRWrapper:
+    INFERENCE_FIELDS: tuple[str, ...] = ("lang", "psm", "oem", "config")
+
     def __init__(self, config: TesseractConfig) -> None:
-        self._config = config
+        import pytesseract
 
-    def predict(self, image: np.ndarray) -> Any:
-        try:
-            pytesseract.get_tesseract_version()
-        except Exception:
+        self._pytesseract = pytesseract
+        self._version, self._languages = _probe_tesseract()
+        self.configure(config)
+
+    def configure(self, config: TesseractConfig) -> None:
+        missing = [lang for lang in config.lang.split("+") if lang not in (self._languages or {lang})]
+
+        if missing:
             raise RuntimeError(
-                "Tesseract is not installed or not in PATH.\nInstall Tesseract and ensure it is in the system PATH.",
+                f"Tesseract language data not installed: {', '.join(missing)}.\n"
+                f"Available languages: {', '.join(sorted(self._languages))}",
             )
 
+        self._config = config
+
+    def predict(self, image: np.ndarray) -> OCRResult:
+        pytesseract = self._pytesseract
+
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
 
         config_parts = [f"--psm {self._config.psm}", f"--oem {self._config.oem}"]
@@ -87,37 +151,54 @@ class TesseractOCRWrapper:
         except Exception as exception:
             raise RuntimeError(f"Error executing Tesseract: {exception}") from exception
 
-        texts = []
-        scores = []
-        boxes = []
+        texts = [text.strip() for text in data["text"]]
+        words = np.flatnonzero([bool(text) for text in texts])
 
-        for i in range(len(data["text"])):
-            text = data["text"][i].strip()
+        conf = np.asarray(data["conf"], dtype=np.float32)[words]
+        x, y, w, h = (np.asarray(data[key], dtype=np.float32)[words] for key in ("left", "top", "width", "height"))
 
-            if not text:
-                continue
+        return OCRResult(texts, np.where(conf == -1, 0.0, conf / 100.0), np.stack([x, y, x + w, y + h], axis=1), words)
 
-            conf = float(data["conf"][i]) if data["conf"][i] != -1 else 0.0
-            x = data["left"][i]
-            y = data["top"][i]
-            w = data["width"][i]
-            h = data["height"][i]
+    def predict_batch(self, images: Sequence[np.ndarray]) -> list[OCRResult]:
+        if not images:
+            return []
 
-            texts.append(text)
-            scores.append(conf / 100.0)
-            boxes.append([[x, y], [x + w, y], [x + w, y + h], [x, y + h]])
-
-        return [
-            {
-                "rec_texts": texts,
-                "rec_scores": scores,
-                "det_boxes": boxes,
-            },
-        ]
+        # Every image is a separate tesseract process, so they are recognized concurrently
+        with ThreadPoolExecutor(min(len(images), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.predict, images))
 
 
 class EasyOCRWrapper:
+    INFERENCE_FIELDS: tuple[str, ...] = (
+        "decoder",
+        "beam_width",
+        "batch_size",
+        "workers",
+        "allowlist",
+        "blocklist",
+        "detail",
+        "paragraph",
+        "min_size",
+        "rotation_info",
+        "contrast_ths",
+        "adjust_contrast",
+        "text_threshold",
+        "low_text",
+        "link_threshold",
+        "canvas_size",
+        "mag_ratio",
+        "slope_ths",
+        "ycenter_ths",
+        "height_ths",
+        "width_ths",
+        "add_margin",
+        "x_ths",
+        "y_ths",
+    )
+
     def __init__(self, config: EasyOCRConfig) -> None:
+        import easyocr
+
         self._config = config
         self._reader = easyocr.Reader(
             lang_list=config.lang_list,
@@ -130,86 +211,80 @@ class EasyOCRWrapper:
             recognizer=config.recognizer,
         )
 
-    def predict(self, image: np.ndarray) -> Any:
-        results = self._reader.readtext(
-            image,
-            decoder=self._config.decoder,
-            beamWidth=self._config.beam_width,
-            batch_size=self._config.batch_size,
-            workers=self._config.workers,
-            allowlist=self._config.allowlist,
-            blocklist=self._config.blocklist,
-            detail=self._config.detail,
-            paragraph=self._config.paragraph,
-            min_size=self._config.min_size,
-            rotation_info=self._config.rotation_info,
-            contrast_ths=self._config.contrast_ths,
-            adjust_contrast=self._config.adjust_contrast,
-            text_threshold=self._config.text_threshold,
-            low_text=self._config.low_text,
-            link_threshold=self._config.link_threshold,
-            canvas_size=self._config.canvas_size,
-            mag_ratio=self._config.mag_ratio,
-            slope_ths=self._config.slope_ths,
-            ycenter_ths=self._config.ycenter_ths,
-            height_ths=self._config.height_ths,
-            width_ths=self._config.width_ths,
-            add_margin=self._config.add_margin,
-            x_ths=self._config.x_ths,
-            y_ths=self._config.y_ths,
-        )
-
-        texts = []
-        scores = []
-        boxes = []
-
-        for result in results:
-            if len(result) >= 3:
-                box_coords = result[0]
-                text = result[1]
-                confidence = result[2]
-
-                texts.append(text)
-                scores.append(float(confidence))
-                boxes.append(box_coords)
-
-        return [
-            {
-                "rec_texts": texts,
-                "rec_scores": scores,
-                "det_boxes": boxes,
-            },
-        ]
-
-
-def _to_lang_det(value: str) -> LangDet:
-    return {"ch": LangDet.CH, "en": LangDet.EN, "multi": LangDet.MULTI}[value]
-
-
-def _to_lang_rec(value: str) -> LangRec:
-    return {"ch": LangRec.CH, "en": LangRec.EN}[value]
-
-
-def _to_ocr_version(value: str) -> OCRVersion:
-    return {"PP-OCRv4": OCRVersion.PPOCRV4, "PP-OCRv5": OCRVersion.PPOCRV5}[value]
-
+    def configure(self, config: EasyOCRConfig) -> None:
+        self._config = config
 
-def _to_model_type(value: str) -> ModelType:
-    return {"mobile": ModelType.MOBILE, "server": ModelType.SERVER}[value]
+    def predict(self, image: np.ndarray) -> OCRResult:
+        return self._to_result(self._reader.readtext(image, **self._get_readtext_kwargs()))
+
+    def predict_batch(self, images: Sequence[np.ndarray]) -> list[OCRResult]:
+        # readtext_batched stacks images into one detector batch, which needs them to share a shape
+        if len(images) < 2 or len({image.shape for image in images}) > 1:
+            return [self.predict(image) for image in images]
+
+        batched = self._reader.readtext_batched(list(images), **self._get_readtext_kwargs())
+        return [self._to_result(results) for results in batched]
+
+    def _get_readtext_kwargs(self) -> dict[str, Any]:
+        return {
+            "decoder": self._config.decoder,
+            "beamWidth": self._config.beam_width,
+            "batch_size": self._config.batch_size,
+            "workers": self._config.workers,
+            "allowlist": self._config.allowlist,
+            "blocklist": self._config.blocklist,
+            "detail": self._config.detail,
+            "paragraph": self._config.paragraph,
+            "min_size": self._config.min_size,
+            "rotation_info": self._config.rotation_info,
+            "contrast_ths": self._config.contrast_ths,
+            "adjust_contrast": self._config.adjust_contrast,
+            "text_threshold": self._config.text_threshold,
+            "low_text": self._config.low_text,
+            "link_threshold": self._config.link_threshold,
+            "canvas_size": self._config.canvas_size,
+            "mag_ratio": self._config.mag_ratio,
+            "slope_ths": self._config.slope_ths,
+            "ycenter_ths": self._config.ycenter_ths,
+            "height_ths": self._config.height_ths,
+            "width_ths": self._config.width_ths,
+            "add_margin": self._config.add_margin,
+            "x_ths": self._config.x_ths,
+            "y_ths": self._config.y_ths,
+        }
+
+    @staticmethod
+    def _to_result(results: list) -> OCRResult:
+        # Entries are (box, text, confidence); paragraph mode drops confidences and is skipped as before
+        lines = [result for result in results if isinstance(result, list | tuple) and len(result) >= 3]
+
+        return OCRResult(
+            [line[1] for line in lines],
+            [line[2] for line in lines],
+            [line[0] for line in lines],
+        )
 
 
 class RapidOCRWrapper:
+    INFERENCE_FIELDS: tuple[str, ...] = ("text_score", "box_thresh", "unclip_ratio")
+
     def __init__(self, config: RapidOCRConfig) -> None:
+        from rapidocr import LangDet, LangRec, ModelType, OCRVersion, RapidOCR
+
         self._config = config
-        rec_lang = LangRec.CH if config.lang_type == "multi" else _to_lang_rec(config.lang_type)
+        det_lang = {"ch": LangDet.CH, "en": LangDet.EN, "multi": LangDet.MULTI}[config.lang_type]
+        rec_lang = LangRec.CH if config.lang_type == "multi" else {"ch": LangRec.CH, "en": LangRec.EN}[config.lang_type]
+        ocr_version = {"PP-OCRv4": OCRVersion.PPOCRV4, "PP-OCRv5": OCRVersion.PPOCRV5}[config.ocr_version]
+        model_type = {"mobile": ModelType.MOBILE, "server": ModelType.SERVER}[config.model_type]
+
         self._engine = RapidOCR(
             params={
-                "Det.lang_type": _to_lang_det(config.lang_type),
+                "Det.lang_type": det_lang,
                 "Rec.lang_type": rec_lang,
-                "Det.ocr_version": _to_ocr_version(config.ocr_version),
-                "Rec.ocr_version": _to_ocr_version(config.ocr_version),
-                "Det.model_type": _to_model_type(config.model_type),
-                "Rec.model_type": _to_model_type(config.model_type),
+                "Det.ocr_version": ocr_version,
+                "Rec.ocr_version": ocr_version,
+                "Det.model_type": model_type,
+                "Rec.model_type": model_type,
                 "Global.use_det": config.use_det,
                 "Global.use_cls": config.use_cls,
                 "Global.use_rec": config.use_rec,
@@ -231,38 +306,406 @@ class RapidOCRWrapper:
                 "Rec.rec_batch_num": config.rec_batch_num,
             },
         )
+        self.configure(config)
 
-    def predict(self, image: np.ndarray) -> Any:
-        result = self._engine(image)
+    def configure(self, config: RapidOCRConfig) -> None:
+        self._config = config
+        self._call_kwargs = {name: getattr(config, name) for name in self.INFERENCE_FIELDS}
 
-        if result is None or not hasattr(result, "txts"):
-            return [{"rec_texts": [], "rec_scores": [], "det_boxes": []}]
+    def predict(self, image: np.ndarray) -> OCRResult:
+        result = self._engine(image, **self._call_kwargs)
 
-        texts = list(result.txts) if result.txts else []
-        scores = list(result.scores) if result.scores else []
-        boxes = [box.tolist() for box in result.boxes] if hasattr(result, "boxes") and result.boxes is not None else []
+        if result is None or not getattr(result, "txts", None) or getattr(result, "boxes", None) is None:
+            return OCRResult.empty()
+
+        return OCRResult(result.txts, result.scores, result.boxes)
+
+    def predict_batch(self, images: Sequence[np.ndarray]) -> list[OCRResult]:
+        # RapidOCR takes one image per call; text lines within an image are batched by rec_batch_num
+        return [self.predict(image) for image in images]
+
+
+# OCR engine name -> (Python package it needs, wrapper class, OCRConfig attribute holding its settings)
+_BACKENDS: dict[str, tuple[str, type[OCRProtocol], str]] = {
+    "paddleocr": ("paddleocr", PaddleOCRWrapper, "paddleocr_config"),
+    "tesseract": ("pytesseract", TesseractOCRWrapper, "tesseract_config"),
+    "easyocr": ("easyocr", EasyOCRWrapper, "easyocr_config"),
+    "rapidocr": ("rapidocr", RapidOCRWrapper, "rapidocr_config"),
+}
+
+
+@dataclass
+class _PooledEngine:
+    engine: OCRProtocol
+    nbytes: int
+    last_used: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class OCREnginePool:
+    def __init__(
+        self,
+        max_engines: int | None = OCR_ENGINE_POOL_MAX_ENGINES,
+        max_bytes: int | None = OCR_ENGINE_POOL_MAX_BYTES,
+        idle_seconds: float | None = OCR_ENGINE_IDLE_SECONDS,
+    ) -> None:
+        self.max_engines = max_engines
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds
+
+        self._engines: OrderedDict[str, _PooledEngine] = OrderedDict()
+        self._construction_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, config: OCRConfig | None = None) -> OCRProtocol:
+        return self._acquire(config)[0].engine
+
+    def predict(self, image: np.ndarray, config: OCRConfig | None = None) -> OCRResult:
+        entry, engine_config = self._acquire(config)
+
+        # Inference settings live on the shared instance, so applying them and predicting must not interleave
+        with entry.lock:
+            entry.engine.configure(engine_config)
+            return entry.engine.predict(image)
+
+    def predict_batch(self, images: Sequence[np.ndarray], config: OCRConfig | None = None) -> list[OCRResult]:
+        entry, engine_config = self._acquire(config)
+
+        with entry.lock:
+            entry.engine.configure(engine_config)
+            return entry.engine.predict_batch(images)
+
+    def release_idle(self) -> int:
+        if self.idle_seconds is None:
+            return 0
+
+        deadline = time.monotonic() - self.idle_seconds
+
+        with self._lock:
+            idle = [key for key, entry in self._engines.items() if entry.last_used < deadline]
+            return sum(self._release(key) for key in idle)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._engines):
+                self._release(key)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(entry.nbytes for entry in self._engines.values())
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def _acquire(self, config: OCRConfig | None) -> tuple[_PooledEngine, Config]:
+        if config is None:
+            config = OCRConfig()
+
+        name = config.ocr_type if config.ocr_type in _BACKENDS else "paddleocr"
+        module, wrapper, config_name = _BACKENDS[name]
+        engine_config = getattr(config, config_name)
+        key = _get_engine_key(name, engine_config, wrapper.INFERENCE_FIELDS)
+
+        with self._lock:
+            construction_lock = self._construction_locks.setdefault(key, threading.Lock())
+
+        # Each engine is built under its own lock, so concurrent requests never load the same model twice
+        # while different engines load in parallel
+        with construction_lock:
+            with self._lock:
+                entry = self._engines.get(key)
+
+            if entry is None:
+                entry = _PooledEngine(*_construct_engine(name, module, wrapper, engine_config))
+
+                with self._lock:
+                    self._engines[key] = entry
+
+        with self._lock:
+            if key in self._engines:
+                self._engines.move_to_end(key)
+
+            entry.last_used = time.monotonic()
+            self._evict()
+
+        return entry, engine_config
+
+    def _evict(self) -> None:
+        # The most recently used engine is never evicted, and engines busy predicting are skipped
+        for key in list(self._engines)[:-1]:
+            if not self._over_budget():
+                break
+
+            if not self._engines[key].lock.locked():
+                self._release(key)
+
+    def _over_budget(self) -> bool:
+        if self.max_engines is not None and len(self._engines) > self.max_engines:
+            return True
+
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
+
+    def _release(self, key: str) -> bool:
+        entry = self._engines.get(key)
+
+        if entry is None or entry.lock.locked():
+            return False
+
+        del self._engines[key]
+        self._construction_locks.pop(key, None)
+        return True
 
-        return [
-            {
-                "rec_texts": texts,
-                "rec_scores": scores,
-                "det_boxes": boxes,
-            },
-        ]
+
+_engine_pool = OCREnginePool()
+
+
+def register_ocr_backend(name: str, module: str, wrapper: type[OCRProtocol], config_name: str) -> None:
+    _BACKENDS[name] = (module, wrapper, config_name)
+
+
+def get_ocr_backends() -> list[str]:
+    return list(_BACKENDS)
+
+
+def get_available_ocr_backends() -> list[str]:
+    return [name for name in _BACKENDS if is_ocr_backend_available(name)]
+
+
+def is_ocr_backend_available(name: str) -> bool:
+    if name not in _BACKENDS:
+        return False
+
+    try:
+        return importlib.util.find_spec(_BACKENDS[name][0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def get_ocr_engine_pool() -> OCREnginePool:
+    return _engine_pool
 
 
-@ocr_cache(max_size=16)
 def create_ocr(config: OCRConfig | None = None) -> OCRProtocol:
+    return _engine_pool.acquire(config)
+
+
+def prepare_ocr_image(image: np.ndarray) -> np.ndarray:
+    if len(image.shape) == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+
+    return image
+
+
+def warm_up_ocr(config: OCRConfig | None = None) -> None:
+    # Detection alone skips the recognizer on blank input, so the dummy image carries a line of text
+    image = np.full((48, 192, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Image Lab", (8, 34), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    _engine_pool.predict(image, config)
+
+
+def get_ocr_settings_fingerprint(config: OCRConfig | None = None) -> str:
     if config is None:
         config = OCRConfig()
 
-    if config.ocr_type == "tesseract":
-        return TesseractOCRWrapper(config.tesseract_config)
+    name = config.ocr_type if config.ocr_type in _BACKENDS else "paddleocr"
+    settings: list[Any] = [name, getattr(config, _BACKENDS[name][2]).fingerprint(), config.regions]
+
+    if config.tiled:
+        settings.extend([config.tile_size, config.tile_overlap])
+
+    # Display-only settings such as min_display_confidence_percent and other engines' configs are left out
+    return hashlib.blake2b(repr(settings).encode(), digest_size=8).hexdigest()
+
+
+def _get_result_key_args(image: np.ndarray, config: OCRConfig | None = None) -> tuple:
+    return image, get_ocr_settings_fingerprint(config)
+
+
+@ocr_cache(
+    max_size=OCR_RESULT_CACHE_SIZE,
+    max_bytes=OCR_RESULT_CACHE_MAX_BYTES,
+    persistent=True,
+    key_args=_get_result_key_args,
+)
+def recognize_text(image: np.ndarray, config: OCRConfig | None = None) -> OCRResult:
+    if config is not None and config.regions:
+        return recognize_regions(image, config.regions, config)
+
+    if config is not None and config.tiled and max(image.shape[:2]) > config.tile_size:
+        return recognize_text_tiled(image, config)
+
+    return _engine_pool.predict(image, config)
+
+
+def recognize_text_batch(images: Sequence[np.ndarray], config: OCRConfig | None = None) -> list[OCRResult]:
+    return _engine_pool.predict_batch(images, config)
+
+
+def recognize_regions(
+    image: np.ndarray,
+    regions: Sequence[tuple[int, int, int, int]],
+    config: OCRConfig | None = None,
+) -> OCRResult:
+    h, w = image.shape[:2]
+    origins = []
+    crops = []
+
+    for x1, y1, x2, y2 in regions:
+        x1, x2 = sorted((max(0, min(w, int(x1))), max(0, min(w, int(x2)))))
+        y1, y2 = sorted((max(0, min(h, int(y1))), max(0, min(h, int(y2)))))
+
+        if x2 > x1 and y2 > y1:
+            origins.append((x1, y1))
+            crops.append(image[y1:y2, x1:x2])
+
+    results = recognize_text_batch(crops, config) if crops else []
+    return OCRResult.concatenate([result.offset(x, y) for (x, y), result in zip(origins, results, strict=True)])
+
+
+def recognize_text_tiled(image: np.ndarray, config: OCRConfig | None = None) -> OCRResult:
+    if config is None:
+        config = OCRConfig()
+
+    tile_size = config.tile_size
+    overlap = min(config.tile_overlap, tile_size // 2)
+
+    h, w = image.shape[:2]
+    origins = [(x, y) for y in _get_tile_starts(h, tile_size, overlap) for x in _get_tile_starts(w, tile_size, overlap)]
+    tiles = [image[y : y + tile_size, x : x + tile_size] for x, y in origins]
+
+    results = []
+    cut = []
+
+    for (x, y), tile, result in zip(origins, tiles, recognize_text_batch(tiles, config), strict=True):
+        tile_h, tile_w = tile.shape[:2]
+        result = result.offset(x, y)
+
+        results.append(result)
+        cut.append(_touches_inner_edges(result.rects, (x, y, x + tile_w, y + tile_h), (w, h)))
+
+    return _merge_duplicates(OCRResult.concatenate(results), np.concatenate(cut))
+
+
+def _construct_engine(
+    name: str,
+    module: str,
+    wrapper: type[OCRProtocol],
+    config: Config,
+) -> tuple[OCRProtocol, int]:
+    if not is_ocr_backend_available(name):
+        raise RuntimeError(f"OCR engine '{name}' is not available. Install the '{module}' package to use it.")
+
+    # Engines loading at the same time each count the others' growth too, which errs towards evicting early
+    resident_bytes = _get_resident_bytes()
+
+    try:
+        engine = wrapper(config)
+    except ImportError as exception:
+        raise RuntimeError(f"OCR engine '{name}' failed to load: {exception}") from exception
+
+    return engine, max(0, _get_resident_bytes() - resident_bytes)
+
+
+@functools.cache
+def _probe_tesseract() -> tuple[str, frozenset[str] | None]:
+    # Each probe spawns the tesseract binary, so it runs once per process; failures are not cached
+    import pytesseract
+
+    try:
+        version = str(pytesseract.get_tesseract_version())
+    except Exception as exception:
+        raise RuntimeError(
+            "Tesseract is not installed or not in PATH.\nInstall Tesseract and ensure it is in the system PATH.",
+        ) from exception
+
+    try:
+        languages = frozenset(pytesseract.get_languages(config=""))
+    except Exception:
+        languages = None
+
+    return version, languages
+
+
+def _get_tile_starts(length: int, tile_size: int, overlap: int) -> list[int]:
+    if length <= tile_size:
+        return [0]
+
+    # Spread tiles evenly so every seam gets at least the requested overlap
+    count = -(-(length - overlap) // (tile_size - overlap))
+    return [round(i * (length - tile_size) / (count - 1)) for i in range(count)]
+
+
+def _touches_inner_edges(rects: np.ndarray, tile: tuple[int, int, int, int], size: tuple[int, int]) -> np.ndarray:
+    # A line touching a seam inside the image was probably cut by the tile and is complete in a neighbour
+    x1, y1, x2, y2 = tile
+    inner = np.array([x1 > 0, y1 > 0, x2 < size[0], y2 < size[1]])
+    touching = np.stack(
+        [rects[:, 0] <= x1 + 1, rects[:, 1] <= y1 + 1, rects[:, 2] >= x2 - 1, rects[:, 3] >= y2 - 1],
+        axis=1,
+    )
+
+    return (touching & inner).any(axis=1)
+
+
+def _merge_duplicates(result: OCRResult, cut: np.ndarray) -> OCRResult:
+    rects = result.rects
+    areas = np.clip(rects[:, 2] - rects[:, 0], 0, None) * np.clip(rects[:, 3] - rects[:, 1], 0, None)
+    texts = result.texts
+    kept = np.zeros(len(result), dtype=bool)
+
+    # Complete lines win over cut ones, then larger boxes over their fragments, then confidence decides
+    for i in np.lexsort((-result.scores, -areas, cut)):
+        others = np.flatnonzero(kept)
+        corners = np.minimum(rects[others, 2:], rects[i, 2:]) - np.maximum(rects[others, :2], rects[i, :2])
+        intersection = np.clip(corners, 0, None).prod(axis=1)
+
+        iou = intersection / np.maximum(areas[others] + areas[i] - intersection, 1e-6)
+        containment = intersection / np.maximum(np.minimum(areas[others], areas[i]), 1e-6)
+        overlap = (iou >= OCR_TILE_IOU_THRESHOLD) | (containment >= OCR_TILE_CONTAINMENT_THRESHOLD)
+        overlapping = (intersection > 0) & overlap
+
+        kept[i] = not any(_texts_match(texts[i], texts[j]) for j in others[overlapping])
+
+    indices = np.flatnonzero(kept)
+    return result.select(indices[np.lexsort((rects[indices, 0], rects[indices, 1]))])
+
+
+def _texts_match(text_a: str, text_b: str) -> bool:
+    # An empty detection would match anything, and must not suppress a real line it overlaps
+    if not text_a.strip() or not text_b.strip():
+        return False
+
+    # A fragment cut at a seam matches part of the full line, so similarity is measured against the shorter text
+    shorter, longer = sorted((text_a, text_b), key=len)
+    match = difflib.SequenceMatcher(None, shorter, longer).find_longest_match()
+
+    return match.size >= OCR_TILE_TEXT_SIMILARITY * len(shorter)
+
+
+def _get_engine_key(name: str, config: Config, inference_fields: tuple[str, ...]) -> str:
+    values = [(f.name, getattr(config, f.name)) for f in fields(config) if f.name not in inference_fields]
+    return f"{name}_{hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()}"
+
+
+def _get_resident_bytes() -> int:
+    # Growth of the resident set while constructing an engine approximates the memory its models hold
+    if importlib.util.find_spec("psutil") is not None:
+        import psutil
+
+        return psutil.Process().memory_info().rss
 
-    if config.ocr_type == "easyocr":
-        return EasyOCRWrapper(config.easyocr_config)
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
 
-    if config.ocr_type == "rapidocr":
-        return RapidOCRWrapper(config.rapidocr_config)
+    try:
+        import resource
+    except ImportError:
+        # Windows without psutil has no cheap measure, so only the engine count limits the pool
+        return 0
 
-    return PaddleOCRWrapper(config.paddleocr_config)
+    # The peak only grows, so an engine loaded below an earlier peak counts as free and the count limit applies
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
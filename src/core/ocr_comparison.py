@@ -0,0 +1,203 @@
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+
+from src.config import OCRConfig
+from src.core.ocr import get_ocr_backends, get_ocr_engine_pool, recognize_text
+from src.core.ocr_result import OCRResult
+
+OCR_FUSION_IOU_THRESHOLD: float = 0.5
+OCR_COMPARISON_COLUMN_WIDTH: int = 28
+
+
+@dataclass(frozen=True)
+class EngineComparison:
+    engine: str
+    result: OCRResult | None
+    error: Exception | None
+    load_seconds: float
+    seconds: float
+
+
+def compare_ocr_engines(
+    image: np.ndarray,
+    engines: Sequence[str],
+    config: OCRConfig | None = None,
+) -> list[EngineComparison]:
+    if config is None:
+        config = OCRConfig()
+
+    unknown = [engine for engine in engines if engine not in get_ocr_backends()]
+
+    if unknown:
+        raise RuntimeError(f"Unknown OCR engines: {', '.join(unknown)}")
+
+    configs = []
+
+    for engine in engines:
+        engine_config = deepcopy(config)
+        engine_config.ocr_type = engine
+        configs.append(engine_config)
+
+    # The pool builds and runs each engine under that engine's own lock, and inference runs in native code or
+    # subprocesses outside the GIL, so threads load and run the engines concurrently with their own thread settings
+    with ThreadPoolExecutor(max(1, len(configs)), thread_name_prefix="ocr-compare") as executor:
+        return list(executor.map(partial(_run_engine, image), configs))
+
+
+def match_ocr_results(results: Sequence[OCRResult], iou_threshold: float = OCR_FUSION_IOU_THRESHOLD) -> np.ndarray:
+    if not results:
+        return np.empty((0, 0), dtype=np.int64)
+
+    combined = OCRResult.concatenate(results)
+    sources = np.repeat(np.arange(len(results)), [len(result) for result in results])
+    offsets = np.cumsum([0] + [len(result) for result in results[:-1]])
+
+    rects = combined.rects
+    areas = np.clip(rects[:, 2] - rects[:, 0], 0, None) * np.clip(rects[:, 3] - rects[:, 1], 0, None)
+    assigned = np.zeros(len(combined), dtype=bool)
+    rows = []
+
+    # The most confident line seeds each group, which then takes the best overlapping line of every other engine
+    for i in np.argsort(-combined.scores, kind="stable"):
+        if assigned[i]:
+            continue
+
+        candidates = np.flatnonzero(~assigned & (sources != sources[i]))
+        corners = np.minimum(rects[candidates, 2:], rects[i, 2:]) - np.maximum(rects[candidates, :2], rects[i, :2])
+        intersection = np.clip(corners, 0, None).prod(axis=1)
+        iou = intersection / np.maximum(areas[candidates] + areas[i] - intersection, 1e-6)
+
+        candidates = candidates[iou >= iou_threshold]
+        candidates = candidates[np.lexsort((-combined.scores[candidates], sources[candidates]))]
+        _, first = np.unique(sources[candidates], return_index=True)
+        members = np.append(candidates[first], i)
+
+        row = np.full(len(results), -1, dtype=np.int64)
+        row[sources[members]] = members - offsets[sources[members]]
+        assigned[members] = True
+        rows.append(row)
+
+    if not rows:
+        return np.empty((0, len(results)), dtype=np.int64)
+
+    matches = np.stack(rows)
+    anchors = np.array([rects[members, :2].mean(axis=0) for members in _get_members(matches, offsets)])
+
+    return matches[np.lexsort((anchors[:, 0], anchors[:, 1]))]
+
+
+def fuse_ocr_results(results: Sequence[OCRResult], matches: np.ndarray | None = None) -> OCRResult:
+    if matches is None:
+        matches = match_ocr_results(results)
+
+    texts = []
+    scores = []
+    boxes = []
+
+    for row in matches:
+        votes: dict[str, float] = {}
+        members = [(engine, index) for engine, index in enumerate(row) if index >= 0]
+
+        # Lines are voted on by summed confidence; spacing differences between engines do not split the vote
+        for engine, index in members:
+            key = _normalize_text(results[engine].texts[index])
+            votes[key] = votes.get(key, 0.0) + float(results[engine].scores[index])
+
+        winner, support = max(votes.items(), key=lambda item: item[1])
+        winners = [member for member in members if _normalize_text(results[member[0]].texts[member[1]]) == winner]
+        weights = np.array([results[engine].scores[index] for engine, index in winners], dtype=np.float32)
+
+        texts.append(winner)
+        # Agreement scales confidence, so a line read by a single engine ranks below one all engines agree on
+        scores.append(support / len(results))
+        boxes.append(
+            np.average(
+                [results[engine].boxes[index] for engine, index in winners],
+                axis=0,
+                weights=np.maximum(weights, 1e-6),
+            ),
+        )
+
+    return OCRResult(texts, scores, np.array(boxes, dtype=np.float32).reshape(-1, 4, 2))
+
+
+def format_ocr_comparison(comparisons: Sequence[EngineComparison], fused: OCRResult | None = None) -> str:
+    width = OCR_COMPARISON_COLUMN_WIDTH
+    lines = [f"{'Engine':<14}{'Load (ms)':>11}{'OCR (ms)':>11}{'Lines':>8}{'Mean conf':>11}  Status"]
+
+    for comparison in comparisons:
+        result = comparison.result
+
+        if result is None:
+            lines.append(f"{comparison.engine:<14}{comparison.load_seconds * 1000:>11.1f}{'':>30}  {comparison.error}")
+            continue
+
+        mean = f"{result.scores.mean() * 100:.1f}%" if len(result) else ""
+        lines.append(
+            f"{comparison.engine:<14}{comparison.load_seconds * 1000:>11.1f}{comparison.seconds * 1000:>11.1f}"
+            f"{len(result):>8}{mean:>11}  ok",
+        )
+
+    succeeded = [comparison for comparison in comparisons if comparison.result is not None]
+
+    if not succeeded:
+        return "\n".join(lines)
+
+    results = [comparison.result for comparison in succeeded]
+    matches = match_ocr_results(results)
+    columns = [comparison.engine for comparison in succeeded]
+
+    if fused is not None:
+        columns.append("fused")
+
+    lines.append("")
+    lines.append(" | ".join(f"{column:<{width}}" for column in columns).rstrip())
+    lines.append("-+-".join("-" * width for _ in columns))
+
+    for row_index, row in enumerate(matches):
+        cells = [_format_cell(results[engine], index) for engine, index in enumerate(row)]
+
+        if fused is not None and row_index < len(fused):
+            cells.append(_format_cell(fused, row_index))
+
+        lines.append(" | ".join(f"{cell[:width]:<{width}}" for cell in cells).rstrip())
+
+    return "\n".join(lines)
+
+
+def _run_engine(image: np.ndarray, config: OCRConfig) -> EngineComparison:
+    start = time.perf_counter()
+
+    try:
+        # An engine already in the pool reports no load time
+        get_ocr_engine_pool().acquire(config)
+        loaded = time.perf_counter()
+
+        # Cached results would report no latency at all, so every engine runs its full pipeline
+        result = recognize_text.__wrapped__(image, config)
+
+    except Exception as exception:
+        return EngineComparison(config.ocr_type, None, exception, time.perf_counter() - start, 0.0)
+
+    return EngineComparison(config.ocr_type, result, None, loaded - start, time.perf_counter() - loaded)
+
+
+def _get_members(matches: np.ndarray, offsets: np.ndarray) -> list[np.ndarray]:
+    return [(row + offsets)[row >= 0] for row in matches]
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _format_cell(result: OCRResult, index: int) -> str:
+    if index < 0:
+        return ""
+
+    return f"{result.texts[index]} ({result.scores[index] * 100:.0f}%)"
@@ -0,0 +1,151 @@
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+
+
+class OCRResult:
+    def __init__(
+        self,
+        texts: Sequence[Any],
+        scores: Any,
+        boxes: Any,
+        indices: np.ndarray | None = None,
+    ) -> None:
+        self._texts = texts
+        self._indices = indices
+        self._text_list: list[str] | None = None
+
+        self.scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+        self.boxes = _to_quads(boxes)
+
+        self.scores.flags.writeable = False
+        self.boxes.flags.writeable = False
+
+        if len(self.scores) != len(self.boxes) or len(self.scores) != self._count_texts():
+            raise ValueError(
+                f"OCR result needs one score and box per text, got {self._count_texts()} texts, "
+                f"{len(self.scores)} scores and {len(self.boxes)} boxes",
+            )
+
+    @classmethod
+    def empty(cls) -> "OCRResult":
+        return cls([], [], [])
+
+    @classmethod
+    def concatenate(cls, results: Sequence["OCRResult"]) -> "OCRResult":
+        if not results:
+            return cls.empty()
+
+        return cls(
+            [text for result in results for text in result.texts],
+            np.concatenate([result.scores for result in results]),
+            np.concatenate([result.boxes for result in results]),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OCRResult":
+        return cls(data["texts"], data["scores"], data["boxes"])
+
+    @classmethod
+    def load_json(cls, filename: str | Path) -> "OCRResult":
+        return cls.from_dict(json.loads(Path(filename).read_text(encoding="utf-8")))
+
+    @classmethod
+    def load_npz(cls, filename: str | Path) -> "OCRResult":
+        with np.load(filename) as data:
+            return cls(data["texts"].tolist(), data["scores"], data["boxes"])
+
+    @property
+    def texts(self) -> list[str]:
+        # Backends hand over their own text containers; strings are only built when somebody reads them
+        if self._text_list is None:
+            indices = range(len(self._texts)) if self._indices is None else self._indices.tolist()
+            self._text_list = [str(self._texts[i]) for i in indices]
+
+        return self._text_list
+
+    @property
+    def rects(self) -> np.ndarray:
+        return np.concatenate([self.boxes.min(axis=1), self.boxes.max(axis=1)], axis=1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.scores.nbytes + self.boxes.nbytes
+
+    def select(self, selection: np.ndarray) -> "OCRResult":
+        indices = np.arange(len(self))[selection]
+        source = indices if self._indices is None else self._indices[indices]
+
+        return OCRResult(self._texts, self.scores[indices], self.boxes[indices], source)
+
+    def filter(self, min_score: float) -> "OCRResult":
+        return self.select(self.scores >= min_score)
+
+    def offset(self, x: float, y: float) -> "OCRResult":
+        if x == 0 and y == 0:
+            return self
+
+        return OCRResult(self._texts, self.scores, self.boxes + np.array([x, y], dtype=np.float32), self._indices)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "texts": self.texts,
+            "scores": self.scores.tolist(),
+            "boxes": self.boxes.tolist(),
+        }
+
+    def save_json(self, filename: str | Path) -> None:
+        Path(filename).write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def save_npz(self, filename: str | Path) -> None:
+        np.savez_compressed(filename, texts=np.array(self.texts, dtype=str), scores=self.scores, boxes=self.boxes)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __repr__(self) -> str:
+        return f"OCRResult({len(self)} lines)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"texts": self.texts, "scores": self.scores, "boxes": self.boxes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["texts"], state["scores"], state["boxes"])
+
+    def _count_texts(self) -> int:
+        return len(self._texts) if self._indices is None else len(self._indices)
+
+
+def _to_quads(boxes: Any) -> np.ndarray:
+    if isinstance(boxes, np.ndarray) and boxes.ndim == 3 and boxes.shape[1:] == (4, 2):
+        return boxes.astype(np.float32, copy=False)
+
+    if len(boxes) == 0:
+        return np.empty((0, 4, 2), dtype=np.float32)
+
+    array = np.asarray(boxes, dtype=np.float32) if _is_uniform(boxes) else None
+
+    if array is not None and array.ndim == 3 and array.shape[1:] == (4, 2):
+        return array
+
+    if array is not None and array.ndim == 2 and array.shape[1] == 4:
+        # Axis-aligned (x1, y1, x2, y2) rectangles
+        x1, y1, x2, y2 = array.T
+        return np.stack([np.stack([x1, y1], 1), np.stack([x2, y1], 1), np.stack([x2, y2], 1), np.stack([x1, y2], 1)], 1)
+
+    # Polygons with other point counts are reduced to their minimum-area rectangle
+    return np.array(
+        [cv2.boxPoints(cv2.minAreaRect(np.asarray(box, dtype=np.float32).reshape(-1, 2))) for box in boxes],
+        dtype=np.float32,
+    )
+
+
+def _is_uniform(boxes: Any) -> bool:
+    try:
+        return len({np.shape(box) for box in boxes}) == 1
+    except TypeError:
+        return False
@@ -0,0 +1,92 @@
+from dataclasses import replace
+
+import cv2
+import numpy as np
+
+from src.config import ProcessingConfig
+
+# Config fields measured in pixels, with the smallest value each still accepts
+_LENGTH_FIELDS: dict[str, int] = {
+    "resize_width": 1,
+    "resize_height": 1,
+    "denoise_template_window": 3,
+    "denoise_search_window": 3,
+    "noise_reduction_d": 1,
+    "bilateral_d": 1,
+    "bilateral_sigma_space": 1,
+    "gaussian_kernel": 1,
+    "median_kernel": 1,
+    "adaptive_block_size": 3,
+    "vertical_kernel_size": 1,
+    "horizontal_kernel_size": 1,
+    "hough_threshold": 1,
+    "hough_min_line_length": 1,
+    "hough_max_line_gap": 1,
+    "morph_kernel_size": 1,
+    "tophat_kernel_size": 1,
+    "blackhat_kernel_size": 1,
+    "gradient_kernel_size": 1,
+    "morphological_gradient_kernel": 1,
+    "char_sep_kernel_size": 1,
+    "dilation_kernel_size": 1,
+    "erosion_kernel_size": 1,
+    "text_kernel_size": 1,
+    "lbp_radius": 1,
+    "bg_kernel_size": 1,
+}
+
+# Window sizes OpenCV expects to be odd
+_ODD_FIELDS: tuple[str, ...] = ("denoise_template_window", "denoise_search_window")
+
+_SIGMA_FIELDS: tuple[str, ...] = ("gaussian_sigma", "edge_sigma_s", "detail_sigma_s", "unsharp_sigma")
+
+_AREA_FIELDS: tuple[str, ...] = (
+    "min_contour_area",
+    "contour_area_min",
+    "contour_area_max",
+    "cc_min_area",
+    "cc_max_area",
+)
+
+
+def create_proxy(image: np.ndarray, scale: float) -> np.ndarray:
+    if scale >= 1.0:
+        return image
+
+    h, w = image.shape[:2]
+    new_w = max(1, round(w * scale))
+    new_h = max(1, round(h * scale))
+
+    return cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
+
+
+def scale_config(config: ProcessingConfig, scale: float) -> ProcessingConfig:
+    if scale == 1.0:
+        return config
+
+    # Settings measured in pixels follow the proxy; intensities and counts do not, so the preview stays approximate
+    changes: dict[str, object] = {}
+
+    for name, minimum in _LENGTH_FIELDS.items():
+        value = getattr(config, name)
+
+        # Zero or less selects an automatic size, such as a bilateral diameter derived from its sigma
+        if value <= 0:
+            continue
+
+        if name in _ODD_FIELDS:
+            changes[name] = max(minimum, 2 * round((value * scale - 1) / 2) + 1)
+        else:
+            changes[name] = max(minimum, round(value * scale))
+
+    for name in _SIGMA_FIELDS:
+        value = getattr(config, name)
+        changes[name] = min(value, max(1.0, value * scale)) if value > 0 else value
+
+    for name in _AREA_FIELDS:
+        changes[name] = max(1, round(getattr(config, name) * scale * scale))
+
+    if config.bbox is not None:
+        changes["bbox"] = tuple(round(value * scale) for value in config.bbox)
+
+    return replace(config, **changes)
@@ -1,47 +1,236 @@
+import itertools
+import math
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
 import cv2
 import numpy as np
 from skimage.filters import threshold_multiotsu
 
 from src.config import ProcessingConfig
-from src.infra.cache import image_cache
+from src.core.profiling import ProcessingProfile
+from src.infra.cache import LRUCache, image_cache
+
+Operation = Callable[[np.ndarray], np.ndarray]
+
+TILE_SIZE: int = 1024
+PLAN_CACHE_SIZE: int = 16
+
+_plan_cache = LRUCache(max_size=PLAN_CACHE_SIZE)
+
+
+class ProcessingCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ProcessingPlan:
+    operations: tuple[Operation, ...]
+
+    def run(self, image: np.ndarray) -> np.ndarray:
+        for operation in self.operations:
+            image = operation(image)
 
+        return image
+
+    def run_tiled(self, image: np.ndarray, tile_size: int = TILE_SIZE, workers: int | None = None) -> np.ndarray:
+        index = 0
+
+        while index < len(self.operations):
+            operation = self.operations[index]
+            index += 1
+
+            if _get_halo(operation) is None:
+                image = operation(image)
+                continue
+
+            segment = [operation]
+
+            while index < len(self.operations) and _get_halo(self.operations[index]) is not None:
+                segment.append(self.operations[index])
+                index += 1
+
+            halo = sum(_get_halo(operation) for operation in segment)
+            image = _run_tiles(image, segment, halo, tile_size, workers)
+
+        return image
 
-@image_cache(max_size=128)
-def process_image(image: np.ndarray, config: ProcessingConfig | None = None) -> np.ndarray:
+
+def compile_plan(config: ProcessingConfig | None = None) -> ProcessingPlan:
     if config is None:
         config = ProcessingConfig()
 
-    image_processed = image.copy()
-
-    processors = [
-        _apply_input_normalization,
-        _apply_trim_borders,
-        _apply_resize,
-        _apply_crop,
-        _apply_color_space,
-        _apply_deskew,
-        _apply_gamma_correction,
-        _apply_denoising,
-        _apply_filters,
-        _apply_histogram_operations,
-        _apply_line_removal,
-        _apply_morphological_operations,
-        _apply_character_operations,
-        _apply_enhancement_operations,
-        _apply_threshold,
-        _apply_invert,
-        _apply_advanced_morphology,
-        _apply_contour_filtering,
-        _apply_advanced_operations,
-    ]
-
-    for processor in processors:
-        image_processed = processor(image_processed, config)
-
-    return image_processed
-
-
-def _apply_input_normalization(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+    # Compiling builds kernels and lookup tables, so a batch sharing one config pays for it once
+    key = config.fingerprint()
+    plan = _plan_cache.get(key)
+
+    if plan is None:
+        operations: list[Operation] = []
+
+        for compile_stage, _ in _STAGES:
+            operations.extend(compile_stage(config))
+
+        plan = ProcessingPlan(tuple(operations))
+        _plan_cache.put(key, plan)
+
+    return plan
+
+
+@image_cache(max_size=128, read_only=True, persistent=True)
+def process_image(
+    image: np.ndarray,
+    config: ProcessingConfig | None = None,
+    tile_size: int | None = None,
+) -> np.ndarray:
+    plan = compile_plan(config)
+
+    if tile_size is None:
+        return plan.run(image)
+
+    return plan.run_tiled(image, tile_size)
+
+
+def profile_image(
+    image: np.ndarray,
+    config: ProcessingConfig | None = None,
+    trace_memory: bool = False,
+) -> tuple[np.ndarray, ProcessingProfile]:
+    if config is None:
+        config = ProcessingConfig()
+
+    profile = ProcessingProfile(trace_memory)
+
+    for compile_stage, _ in _STAGES:
+        stage = _get_stage_name(compile_stage)
+
+        for operation in compile_stage(config):
+            image = profile.measure(stage, operation, image)
+
+    return image, profile
+
+
+class IncrementalProcessor:
+    def __init__(self) -> None:
+        self._source: np.ndarray | None = None
+        self._stage_keys: list[tuple[Any, ...]] = []
+        self._stage_outputs: list[np.ndarray] = []
+
+    def process(
+        self,
+        image: np.ndarray,
+        config: ProcessingConfig | None = None,
+        cancelled: Callable[[], bool] | None = None,
+        profile: ProcessingProfile | None = None,
+    ) -> np.ndarray:
+        if config is None:
+            config = ProcessingConfig()
+
+        if image is not self._source:
+            self.reset()
+            self._source = image
+
+        image_processed = image
+
+        for index, (compile_stage, fields) in enumerate(_STAGES):
+            stage_key = tuple(getattr(config, name) for name in fields)
+
+            if index < len(self._stage_keys) and self._stage_keys[index] == stage_key:
+                if profile is not None and self._stage_outputs[index] is not image_processed:
+                    profile.record_cached(_get_stage_name(compile_stage), self._stage_outputs[index])
+
+                image_processed = self._stage_outputs[index]
+                continue
+
+            del self._stage_keys[index:]
+            del self._stage_outputs[index:]
+
+            for operation in compile_stage(config):
+                if cancelled is not None and cancelled():
+                    raise ProcessingCancelled
+
+                if profile is not None:
+                    image_processed = profile.measure(_get_stage_name(compile_stage), operation, image_processed)
+                else:
+                    image_processed = operation(image_processed)
+
+            self._stage_keys.append(stage_key)
+            self._stage_outputs.append(image_processed)
+
+        return image_processed
+
+    def reset(self) -> None:
+        self._source = None
+        self._stage_keys.clear()
+        self._stage_outputs.clear()
+
+
+def _get_stage_name(compile_stage: Callable[[ProcessingConfig], list[Operation]]) -> str:
+    return compile_stage.__name__.removeprefix("_compile_")
+
+
+def _local(operation: Operation, halo: int) -> Operation:
+    # Marks an operation whose output pixels depend only on input pixels within halo, so it can run on tiles
+    operation.halo = halo  # type: ignore[attr-defined]
+    return operation
+
+
+def _get_halo(operation: Operation) -> int | None:
+    return getattr(operation, "halo", None)
+
+
+def _run_tiles(
+    image: np.ndarray,
+    operations: list[Operation],
+    halo: int,
+    tile_size: int,
+    workers: int | None,
+) -> np.ndarray:
+    h, w = image.shape[:2]
+
+    if h <= tile_size and w <= tile_size:
+        for operation in operations:
+            image = operation(image)
+
+        return image
+
+    def process_tile(bounds: tuple[int, int, int, int]) -> np.ndarray:
+        y1, y2, x1, x2 = bounds
+        y0, x0 = max(0, y1 - halo), max(0, x1 - halo)
+        tile = image[y0 : min(h, y2 + halo), x0 : min(w, x2 + halo)]
+
+        for operation in operations:
+            tile = operation(tile)
+
+        return tile[y1 - y0 : y2 - y0, x1 - x0 : x2 - x0]
+
+    tiles = [(*rows, *columns) for rows in _split_evenly(h, tile_size) for columns in _split_evenly(w, tile_size)]
+    output: np.ndarray | None = None
+
+    with ThreadPoolExecutor(workers or os.cpu_count()) as executor:
+        for (y1, y2, x1, x2), tile in zip(tiles, executor.map(process_tile, tiles), strict=True):
+            if output is None:
+                output = np.empty((h, w, *tile.shape[2:]), dtype=tile.dtype)
+
+            output[y1:y2, x1:x2] = tile
+
+    return output
+
+
+def _split_evenly(length: int, tile_size: int) -> list[tuple[int, int]]:
+    # Equal tiles avoid narrow leftovers, which some OpenCV filters round differently
+    count = -(-length // tile_size)
+    bounds = [length * index // count for index in range(count + 1)]
+    return list(itertools.pairwise(bounds))
+
+
+def _compile_input_normalization(config: ProcessingConfig) -> list[Operation]:
+    return [_normalize_input]
+
+
+def _normalize_input(image: np.ndarray) -> np.ndarray:
     if not isinstance(image, np.ndarray) or image.ndim not in (2, 3):
         return image
 
@@ -58,51 +247,54 @@ def _apply_input_normalization(image: np.ndarray, config: ProcessingConfig) -> n
     return out
 
 
-def _apply_trim_borders(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+def _compile_trim_borders(config: ProcessingConfig) -> list[Operation]:
     if not config.trim_borders_enabled:
-        return image
-
-    gray = _ensure_grayscale(image)
-    h, w = gray.shape[:2]
-
-    if h < 2 or w < 2:
-        return image
-
-    top_median = float(np.median(gray[0, :]))
-    bottom_median = float(np.median(gray[-1, :]))
-    left_median = float(np.median(gray[:, 0]))
-    right_median = float(np.median(gray[:, -1]))
+        return []
 
     tolerance = max(0, config.trim_borders_tolerance)
 
-    y1 = 0
-    for r in range(h):
-        if abs(float(np.median(gray[r, :])) - top_median) > tolerance:
-            y1 = r
-            break
-
-    y2 = h
-    for r in range(h - 1, -1, -1):
-        if abs(float(np.median(gray[r, :])) - bottom_median) > tolerance:
-            y2 = r + 1
-            break
+    def trim_borders(image: np.ndarray) -> np.ndarray:
+        gray = _ensure_grayscale(image)
+        h, w = gray.shape[:2]
 
-    x1 = 0
-    for c in range(w):
-        if abs(float(np.median(gray[:, c])) - left_median) > tolerance:
-            x1 = c
-            break
+        if h < 2 or w < 2:
+            return image
 
-    x2 = w
-    for c in range(w - 1, -1, -1):
-        if abs(float(np.median(gray[:, c])) - right_median) > tolerance:
-            x2 = c + 1
-            break
+        top_median = float(np.median(gray[0, :]))
+        bottom_median = float(np.median(gray[-1, :]))
+        left_median = float(np.median(gray[:, 0]))
+        right_median = float(np.median(gray[:, -1]))
+
+        y1 = 0
+        for r in range(h):
+            if abs(float(np.median(gray[r, :])) - top_median) > tolerance:
+                y1 = r
+                break
+
+        y2 = h
+        for r in range(h - 1, -1, -1):
+            if abs(float(np.median(gray[r, :])) - bottom_median) > tolerance:
+                y2 = r + 1
+                break
+
+        x1 = 0
+        for c in range(w):
+            if abs(float(np.median(gray[:, c])) - left_median) > tolerance:
+                x1 = c
+                break
+
+        x2 = w
+        for c in range(w - 1, -1, -1):
+            if abs(float(np.median(gray[:, c])) - right_median) > tolerance:
+                x2 = c + 1
+                break
+
+        if x2 <= x1 or y2 <= y1:
+            return image
 
-    if x2 <= x1 or y2 <= y1:
-        return image
+        return image[y1:y2, x1:x2].copy()
 
-    return image[y1:y2, x1:x2].copy()
+    return [trim_borders]
 
 
 def _ensure_binary(image: np.ndarray) -> np.ndarray:
@@ -139,512 +331,777 @@ def get_dimensions_before_crop(image: np.ndarray, config: ProcessingConfig) -> t
     return new_h, new_w
 
 
-def _apply_crop(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+def _compile_crop(config: ProcessingConfig) -> list[Operation]:
     if not config.crop_enabled or config.bbox is None:
-        return image
+        return []
 
-    h, w = image.shape[:2]
-    x1, y1, x2, y2 = config.bbox
+    bbox_x1, bbox_y1, bbox_x2, bbox_y2 = config.bbox
 
-    x1 = max(0, x1)
-    y1 = max(0, y1)
-    x2 = min(w, x2)
-    y2 = min(h, y2)
+    def crop(image: np.ndarray) -> np.ndarray:
+        h, w = image.shape[:2]
 
-    if x2 > x1 and y2 > y1:
-        return image[y1:y2, x1:x2]
+        x1 = max(0, bbox_x1)
+        y1 = max(0, bbox_y1)
+        x2 = min(w, bbox_x2)
+        y2 = min(h, bbox_y2)
 
-    return image
+        if x2 > x1 and y2 > y1:
+            return image[y1:y2, x1:x2]
+
+        return image
+
+    return [crop]
 
 
-def _apply_resize(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+def _compile_resize(config: ProcessingConfig) -> list[Operation]:
     if not config.resize_enabled:
-        return image
+        return []
 
-    h, w = image.shape[:2]
+    resize_width = config.resize_width
+    resize_height = config.resize_height
+    maintain_aspect_ratio = config.resize_maintain_aspect_ratio
 
-    if config.resize_maintain_aspect_ratio:
-        aspect = w / h
+    def resize(image: np.ndarray) -> np.ndarray:
+        h, w = image.shape[:2]
 
-        if aspect > 1:
-            new_w = config.resize_width
-            new_h = int(config.resize_width / aspect)
+        if maintain_aspect_ratio:
+            aspect = w / h
+
+            if aspect > 1:
+                new_w = resize_width
+                new_h = int(resize_width / aspect)
+            else:
+                new_h = resize_height
+                new_w = int(resize_height * aspect)
         else:
-            new_h = config.resize_height
-            new_w = int(config.resize_height * aspect)
-    else:
-        new_w, new_h = config.resize_width, config.resize_height
+            new_w, new_h = resize_width, resize_height
 
-    if (w, h) != (new_w, new_h):
-        is_upscaling = w < new_w or h < new_h
-        interpolation = cv2.INTER_LANCZOS4 if is_upscaling else cv2.INTER_AREA
+        if (w, h) != (new_w, new_h):
+            is_upscaling = w < new_w or h < new_h
+            interpolation = cv2.INTER_LANCZOS4 if is_upscaling else cv2.INTER_AREA
 
-        image = cv2.resize(image, (new_w, new_h), interpolation=interpolation)
+            image = cv2.resize(image, (new_w, new_h), interpolation=interpolation)
 
-    return image
+        return image
 
+    return [resize]
 
-def _apply_color_space(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
-    if len(image.shape) != 3:
-        return image
 
-    match config.color_space:
-        case "Grayscale":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        case "RGB":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        case "HSV":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        case "LAB":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-        case "YUV":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2YUV)
-        case "YCrCb":
-            return cv2.cvtColor(image, cv2.COLOR_BGR2YCrCb)
-        case _:
+_COLOR_CONVERSIONS: dict[str, int] = {
+    "Grayscale": cv2.COLOR_BGR2GRAY,
+    "RGB": cv2.COLOR_BGR2RGB,
+    "HSV": cv2.COLOR_BGR2HSV,
+    "LAB": cv2.COLOR_BGR2LAB,
+    "YUV": cv2.COLOR_BGR2YUV,
+    "YCrCb": cv2.COLOR_BGR2YCrCb,
+}
+
+
+def _compile_color_space(config: ProcessingConfig) -> list[Operation]:
+    conversion = _COLOR_CONVERSIONS.get(config.color_space)
+
+    if conversion is None:
+        return []
+
+    def convert_color(image: np.ndarray) -> np.ndarray:
+        if len(image.shape) != 3:
             return image
 
+        return cv2.cvtColor(image, conversion)
 
-def _apply_deskew(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+    return [_local(convert_color, 0)]
+
+
+def _compile_deskew(config: ProcessingConfig) -> list[Operation]:
     if not config.deskew_enabled:
-        return image
+        return []
 
-    gray = _ensure_grayscale(image)
-    h, w = gray.shape[:2]
+    method = config.deskew_method
 
-    if config.deskew_method == "min_area_rect":
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    def deskew(image: np.ndarray) -> np.ndarray:
+        gray = _ensure_grayscale(image)
+        h, w = gray.shape[:2]
 
-        if not contours:
-            return image
+        if method == "min_area_rect":
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-        largest = max(contours, key=cv2.contourArea)
+            if not contours:
+                return image
 
-        if cv2.contourArea(largest) < 100:
-            return image
+            largest = max(contours, key=cv2.contourArea)
 
-        rect = cv2.minAreaRect(largest)
-        angle = rect[-1]
+            if cv2.contourArea(largest) < 100:
+                return image
 
-        if angle < -45:
-            angle = 90 + angle
+            rect = cv2.minAreaRect(largest)
+            angle = rect[-1]
 
-        if abs(angle) < 0.5:
-            return image
-    else:
-        edges = cv2.Canny(gray, 50, 150)
-        lines = cv2.HoughLines(edges, 1, np.pi / 180, 200)
+            if angle < -45:
+                angle = 90 + angle
 
-        if lines is None or len(lines) == 0:
-            return image
+            if abs(angle) < 0.5:
+                return image
+        else:
+            edges = cv2.Canny(gray, 50, 150)
+            lines = cv2.HoughLines(edges, 1, np.pi / 180, 200)
 
-        angles = []
-        for line in lines:
-            rho, theta = line[0]
-            angle_deg = np.degrees(theta) - 90
-            if -45 <= angle_deg <= 45:
-                angles.append(angle_deg)
+            if lines is None or len(lines) == 0:
+                return image
 
-        if not angles:
-            return image
+            angles = []
+            for line in lines:
+                rho, theta = line[0]
+                angle_deg = np.degrees(theta) - 90
+                if -45 <= angle_deg <= 45:
+                    angles.append(angle_deg)
 
-        angle = float(np.median(angles))
+            if not angles:
+                return image
 
-        if abs(angle) < 0.5:
-            return image
+            angle = float(np.median(angles))
 
-    center = (w // 2, h // 2)
-    matrix = cv2.getRotationMatrix2D(center, -angle, 1.0)
-    rotated = cv2.warpAffine(
-        image,
-        matrix,
-        (w, h),
-        flags=cv2.INTER_CUBIC,
-        borderMode=cv2.BORDER_REPLICATE,
-    )
+            if abs(angle) < 0.5:
+                return image
 
-    return rotated
+        center = (w // 2, h // 2)
+        matrix = cv2.getRotationMatrix2D(center, -angle, 1.0)
+        rotated = cv2.warpAffine(
+            image,
+            matrix,
+            (w, h),
+            flags=cv2.INTER_CUBIC,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+
+        return rotated
 
+    return [deskew]
 
-def _apply_invert(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+
+def _compile_invert(config: ProcessingConfig) -> list[Operation]:
     if not config.invert_colors:
-        return image
+        return []
 
-    return cv2.bitwise_not(image)
+    def invert(image: np.ndarray) -> np.ndarray:
+        return cv2.bitwise_not(image)
 
+    return [_local(invert, 0)]
 
-def _apply_gamma_correction(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+
+def _compile_gamma_correction(config: ProcessingConfig) -> list[Operation]:
     if not config.gamma_correction or config.gamma_value == 1.0:
-        return image
+        return []
 
     inv_gamma = 1.0 / config.gamma_value
     table = np.array([((i / 255.0) ** inv_gamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
 
-    return cv2.LUT(image, table)
+    def gamma_correction(image: np.ndarray) -> np.ndarray:
+        return cv2.LUT(image, table)
+
+    return [_local(gamma_correction, 0)]
+
 
+def _compile_denoising(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_denoising(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.denoise_nl_means:
-        image = cv2.fastNlMeansDenoising(
-            image,
-            None,
-            config.denoise_h,
-            config.denoise_template_window,
-            config.denoise_search_window,
-        )
+        h = config.denoise_h
+        template_window = config.denoise_template_window
+        search_window = config.denoise_search_window
+
+        def nl_means(image: np.ndarray) -> np.ndarray:
+            return cv2.fastNlMeansDenoising(image, None, h, template_window, search_window)
+
+        operations.append(_local(nl_means, template_window // 2 + search_window // 2))
 
     if config.edge_preserving_filter:
-        image = cv2.edgePreservingFilter(
-            image,
-            flags=config.edge_filter_flags,
-            sigma_s=config.edge_sigma_s,
-            sigma_r=config.edge_sigma_r,
-        )
+        flags = config.edge_filter_flags
+        sigma_s = config.edge_sigma_s
+        sigma_r = config.edge_sigma_r
+
+        def edge_preserving_filter(image: np.ndarray) -> np.ndarray:
+            return cv2.edgePreservingFilter(image, flags=flags, sigma_s=sigma_s, sigma_r=sigma_r)
+
+        operations.append(edge_preserving_filter)
 
     if config.noise_reduction_bilateral:
-        for _ in range(config.bilateral_iterations):
-            image = cv2.bilateralFilter(image, 5, 80, 80)
+        noise_reduction_d = config.noise_reduction_d
+
+        def bilateral_noise_reduction(image: np.ndarray) -> np.ndarray:
+            return cv2.bilateralFilter(image, noise_reduction_d, 80, 80)
+
+        # One operation per iteration so each pass is timed separately
+        noise_reduction_radius = noise_reduction_d // 2 if noise_reduction_d > 0 else round(80 * 1.5)
+        operations.extend(
+            _local(bilateral_noise_reduction, noise_reduction_radius) for _ in range(config.bilateral_iterations)
+        )
+
+    return operations
 
-    return image
 
+def _compile_filters(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_filters(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.bilateral_filter:
-        image = cv2.bilateralFilter(
-            image,
-            config.bilateral_d,
-            config.bilateral_sigma_color,
-            config.bilateral_sigma_space,
-        )
+        d = config.bilateral_d
+        sigma_color = config.bilateral_sigma_color
+        sigma_space = config.bilateral_sigma_space
+
+        def bilateral_filter(image: np.ndarray) -> np.ndarray:
+            return cv2.bilateralFilter(image, d, sigma_color, sigma_space)
+
+        bilateral_radius = d // 2 if d > 0 else round(sigma_space * 1.5)
+        operations.append(_local(bilateral_filter, bilateral_radius))
 
     if config.gaussian_blur:
-        kernel_size = config.gaussian_kernel * 2 + 1
-        image = cv2.GaussianBlur(image, (kernel_size, kernel_size), config.gaussian_sigma)
+        gaussian_size = config.gaussian_kernel * 2 + 1
+        gaussian_sigma = config.gaussian_sigma
+
+        def gaussian_blur(image: np.ndarray) -> np.ndarray:
+            return cv2.GaussianBlur(image, (gaussian_size, gaussian_size), gaussian_sigma)
+
+        operations.append(_local(gaussian_blur, gaussian_size // 2))
 
     if config.median_filter:
-        image = cv2.medianBlur(image, config.median_kernel * 2 + 1)
+        median_size = config.median_kernel * 2 + 1
+
+        def median_filter(image: np.ndarray) -> np.ndarray:
+            return cv2.medianBlur(image, median_size)
+
+        operations.append(_local(median_filter, median_size // 2))
 
     if config.background_subtraction:
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (20, 20))
-        background = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
-        image = cv2.subtract(image, background)
-        image = cv2.add(image, np.full_like(image, config.bg_threshold))
+        bg_kernel_size = config.bg_kernel_size
+        background_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (bg_kernel_size, bg_kernel_size))
+        bg_threshold = config.bg_threshold
 
-    return image
+        def background_subtraction(image: np.ndarray) -> np.ndarray:
+            background = cv2.morphologyEx(image, cv2.MORPH_OPEN, background_kernel)
+            image = cv2.subtract(image, background)
+            return cv2.add(image, np.full_like(image, bg_threshold))
 
+        operations.append(_local(background_subtraction, bg_kernel_size))
 
-def _apply_histogram_operations(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
-    if config.histogram_equalization and len(image.shape) == 2:
-        image = cv2.equalizeHist(image)
+    return operations
 
-    if config.clahe and len(image.shape) == 2:
+
+def _compile_histogram_operations(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
+
+    if config.histogram_equalization:
+
+        def histogram_equalization(image: np.ndarray) -> np.ndarray:
+            return cv2.equalizeHist(image) if len(image.shape) == 2 else image
+
+        operations.append(histogram_equalization)
+
+    clahe = None
+
+    if config.clahe:
         clahe = cv2.createCLAHE(
             clipLimit=config.clahe_clip_limit,
             tileGridSize=(config.clahe_tile_size, config.clahe_tile_size),
         )
-        image = clahe.apply(image)
-    elif config.adaptive_hist_eq and len(image.shape) == 2:
+    elif config.adaptive_hist_eq:
         clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(config.adaptive_hist_kernel, config.adaptive_hist_kernel))
-        image = clahe.apply(image)
 
-    if config.multi_otsu and len(image.shape) == 2 and config.multi_otsu_classes >= 2:
-        thresholds = threshold_multiotsu(image, classes=config.multi_otsu_classes)
-        regions = np.digitize(image, bins=thresholds)
-        image = (regions * (255 // (config.multi_otsu_classes - 1))).astype(np.uint8)
+    if clahe is not None:
 
-    return image
+        def apply_clahe(image: np.ndarray) -> np.ndarray:
+            return clahe.apply(image) if len(image.shape) == 2 else image
+
+        operations.append(apply_clahe)
+
+    if config.multi_otsu and config.multi_otsu_classes >= 2:
+        classes = config.multi_otsu_classes
 
+        def multi_otsu(image: np.ndarray) -> np.ndarray:
+            if len(image.shape) != 2:
+                return image
+
+            thresholds = threshold_multiotsu(image, classes=classes)
+            regions = np.digitize(image, bins=thresholds)
+            return (regions * (255 // (classes - 1))).astype(np.uint8)
+
+        operations.append(multi_otsu)
+
+    return operations
+
+
+def _compile_line_removal(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_line_removal(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.vertical_line_removal:
         vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, config.vertical_kernel_size))
-        vertical_lines = cv2.morphologyEx(image, cv2.MORPH_OPEN, vertical_kernel)
-        image = cv2.subtract(image, vertical_lines)
+
+        def vertical_line_removal(image: np.ndarray) -> np.ndarray:
+            vertical_lines = cv2.morphologyEx(image, cv2.MORPH_OPEN, vertical_kernel)
+            return cv2.subtract(image, vertical_lines)
+
+        operations.append(_local(vertical_line_removal, config.vertical_kernel_size))
 
     if config.horizontal_line_removal:
         horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (config.horizontal_kernel_size, 1))
-        horizontal_lines = cv2.morphologyEx(image, cv2.MORPH_OPEN, horizontal_kernel)
-        image = cv2.subtract(image, horizontal_lines)
 
-    return image
+        def horizontal_line_removal(image: np.ndarray) -> np.ndarray:
+            horizontal_lines = cv2.morphologyEx(image, cv2.MORPH_OPEN, horizontal_kernel)
+            return cv2.subtract(image, horizontal_lines)
 
+        operations.append(_local(horizontal_line_removal, config.horizontal_kernel_size))
+
+    return operations
+
+
+def _compile_morphological_operations(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_morphological_operations(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.stroke_width_normalization:
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2))
+        stroke_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2, 2))
+        stroke_iterations = config.stroke_iterations
 
-        for _ in range(config.stroke_iterations):
-            image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
+        def stroke_width_normalization(image: np.ndarray) -> np.ndarray:
+            for _ in range(stroke_iterations):
+                image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, stroke_kernel)
+
+            return image
+
+        operations.append(_local(stroke_width_normalization, 2 * stroke_iterations))
 
     if config.morphology:
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (config.morph_kernel_size, config.morph_kernel_size))
+        morph_kernel = cv2.getStructuringElement(
+            cv2.MORPH_ELLIPSE,
+            (config.morph_kernel_size, config.morph_kernel_size),
+        )
 
         if config.morph_open:
-            image = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
+
+            def morph_open(image: np.ndarray) -> np.ndarray:
+                return cv2.morphologyEx(image, cv2.MORPH_OPEN, morph_kernel)
+
+            operations.append(_local(morph_open, config.morph_kernel_size))
+
         if config.morph_close:
-            image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
 
-    return image
+            def morph_close(image: np.ndarray) -> np.ndarray:
+                return cv2.morphologyEx(image, cv2.MORPH_CLOSE, morph_kernel)
+
+            operations.append(_local(morph_close, config.morph_kernel_size))
 
+    return operations
+
+
+def _compile_character_operations(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_character_operations(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.character_separation:
-        kernel = cv2.getStructuringElement(
+        sep_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.char_sep_kernel_size, config.char_sep_kernel_size),
         )
 
-        image = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
+        def character_separation(image: np.ndarray) -> np.ndarray:
+            return cv2.morphologyEx(image, cv2.MORPH_OPEN, sep_kernel)
+
+        operations.append(_local(character_separation, config.char_sep_kernel_size))
 
     if config.character_dilation:
         dil_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.dilation_kernel_size, config.dilation_kernel_size),
         )
+        dilation_iterations = config.dilation_iterations
 
-        for _ in range(config.dilation_iterations):
-            image = cv2.dilate(image, dil_kernel, iterations=1)
+        def character_dilation(image: np.ndarray) -> np.ndarray:
+            for _ in range(dilation_iterations):
+                image = cv2.dilate(image, dil_kernel, iterations=1)
+
+            return image
+
+        operations.append(_local(character_dilation, config.dilation_kernel_size // 2 * dilation_iterations))
 
     if config.character_erosion:
         ero_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.erosion_kernel_size, config.erosion_kernel_size),
         )
+        erosion_iterations = config.erosion_iterations
+
+        def character_erosion(image: np.ndarray) -> np.ndarray:
+            for _ in range(erosion_iterations):
+                image = cv2.erode(image, ero_kernel, iterations=1)
+
+            return image
 
-        for _ in range(config.erosion_iterations):
-            image = cv2.erode(image, ero_kernel, iterations=1)
+        operations.append(_local(character_erosion, config.erosion_kernel_size // 2 * erosion_iterations))
 
     if config.noise_dots_removal:
-        binary_image = _ensure_binary(image)
-        contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        fill_black = 0 if len(image.shape) == 2 else (0, 0, 0)
+        min_contour_area = config.min_contour_area
 
-        for contour in contours:
-            if cv2.contourArea(contour) < config.min_contour_area:
-                cv2.drawContours(image, [contour], -1, fill_black, -1)
+        def noise_dots_removal(image: np.ndarray) -> np.ndarray:
+            binary_image = _ensure_binary(image)
+            contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            fill_black = 0 if len(image.shape) == 2 else (0, 0, 0)
+            image = image.copy()
 
-    return image
+            for contour in contours:
+                if cv2.contourArea(contour) < min_contour_area:
+                    cv2.drawContours(image, [contour], -1, fill_black, -1)
+
+            return image
+
+        operations.append(noise_dots_removal)
 
+    return operations
+
+
+def _compile_enhancement_operations(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_enhancement_operations(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.text_enhancement:
         kernel_size = config.text_kernel_size * 2 + 1
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, 1))
-        image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, kernel_size))
-        image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, kernel)
+        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, 1))
+        vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, kernel_size))
+
+        def text_enhancement(image: np.ndarray) -> np.ndarray:
+            image = cv2.morphologyEx(image, cv2.MORPH_CLOSE, horizontal_kernel)
+            return cv2.morphologyEx(image, cv2.MORPH_CLOSE, vertical_kernel)
+
+        operations.append(_local(text_enhancement, kernel_size))
 
     if config.detail_enhancement:
-        if len(image.shape) == 2:
-            color_image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-            enhanced = cv2.detailEnhance(color_image, sigma_s=config.detail_sigma_s, sigma_r=config.detail_sigma_r)
-            image = cv2.cvtColor(enhanced, cv2.COLOR_BGR2GRAY)
-        else:
-            image = cv2.detailEnhance(image, sigma_s=config.detail_sigma_s, sigma_r=config.detail_sigma_r)
+        detail_sigma_s = config.detail_sigma_s
+        detail_sigma_r = config.detail_sigma_r
+
+        def detail_enhancement(image: np.ndarray) -> np.ndarray:
+            if len(image.shape) == 2:
+                color_image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+                enhanced = cv2.detailEnhance(color_image, sigma_s=detail_sigma_s, sigma_r=detail_sigma_r)
+                return cv2.cvtColor(enhanced, cv2.COLOR_BGR2GRAY)
+
+            return cv2.detailEnhance(image, sigma_s=detail_sigma_s, sigma_r=detail_sigma_r)
+
+        operations.append(detail_enhancement)
 
     if config.edge_enhancement:
-        gray_image = _ensure_grayscale(image)
-        edges = cv2.Canny(gray_image, 50, 150)
+        edge_strength = config.edge_strength
 
-        if len(image.shape) == 3:
-            edges = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
+        def edge_enhancement(image: np.ndarray) -> np.ndarray:
+            gray_image = _ensure_grayscale(image)
+            edges = cv2.Canny(gray_image, 50, 150)
 
-        image = cv2.addWeighted(image, 1.0, edges, config.edge_strength, 0)
+            if len(image.shape) == 3:
+                edges = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
+
+            return cv2.addWeighted(image, 1.0, edges, edge_strength, 0)
+
+        operations.append(edge_enhancement)
 
     if config.unsharp_mask:
-        gaussian = cv2.GaussianBlur(image, (0, 0), 2.0)
-        image = cv2.addWeighted(image, config.unsharp_strength, gaussian, 1 - config.unsharp_strength, 0)
+        unsharp_sigma = config.unsharp_sigma
+        unsharp_strength = config.unsharp_strength
+
+        def unsharp_mask(image: np.ndarray) -> np.ndarray:
+            gaussian = cv2.GaussianBlur(image, (0, 0), unsharp_sigma)
+            return cv2.addWeighted(image, unsharp_strength, gaussian, 1 - unsharp_strength, 0)
+
+        operations.append(_local(unsharp_mask, math.ceil(4 * unsharp_sigma)))
 
     if config.sharpen:
-        kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-        sharpened = cv2.filter2D(image, -1, kernel)
-        image = cv2.addWeighted(image, 1 - config.sharpen_strength, sharpened, config.sharpen_strength, 0)
+        sharpen_kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
+        sharpen_strength = config.sharpen_strength
 
-    return image
+        def sharpen(image: np.ndarray) -> np.ndarray:
+            sharpened = cv2.filter2D(image, -1, sharpen_kernel)
+            return cv2.addWeighted(image, 1 - sharpen_strength, sharpened, sharpen_strength, 0)
 
+        operations.append(_local(sharpen, 1))
 
-def _apply_threshold(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
+    return operations
+
+
+def _compile_threshold(config: ProcessingConfig) -> list[Operation]:
     if not config.threshold_enabled:
-        return image
+        return []
+
+    threshold_value = config.threshold_value
 
-    image = _ensure_grayscale(image)
+    if config.adaptive_block_size % 2 == 1:
+        block_size = config.adaptive_block_size
+    else:
+        block_size = config.adaptive_block_size + 1
+
+    adaptive_c = config.adaptive_c
+    halo: int | None = 0
 
     match config.threshold_type:
         case "BINARY":
-            _, image = cv2.threshold(image, config.threshold_value, 255, cv2.THRESH_BINARY)
+
+            def threshold(image: np.ndarray) -> np.ndarray:
+                _, image = cv2.threshold(_ensure_grayscale(image), threshold_value, 255, cv2.THRESH_BINARY)
+                return image
 
         case "BINARY_INV":
-            _, image = cv2.threshold(image, config.threshold_value, 255, cv2.THRESH_BINARY_INV)
+
+            def threshold(image: np.ndarray) -> np.ndarray:
+                _, image = cv2.threshold(_ensure_grayscale(image), threshold_value, 255, cv2.THRESH_BINARY_INV)
+                return image
 
         case "OTSU_BINARY":
-            if image.size > 0 and len(np.unique(image)) > 1:
-                _, image = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            else:
-                _, image = cv2.threshold(image, config.threshold_value, 255, cv2.THRESH_BINARY)
+            halo = None
+
+            def threshold(image: np.ndarray) -> np.ndarray:
+                image = _ensure_grayscale(image)
+
+                if image.size > 0 and len(np.unique(image)) > 1:
+                    _, image = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+                else:
+                    _, image = cv2.threshold(image, threshold_value, 255, cv2.THRESH_BINARY)
+
+                return image
 
         case "ADAPTIVE_MEAN":
-            if config.adaptive_block_size % 2 == 1:
-                block_size = config.adaptive_block_size
-            else:
-                block_size = config.adaptive_block_size + 1
-
-            image = cv2.adaptiveThreshold(
-                image,
-                255,
-                cv2.ADAPTIVE_THRESH_MEAN_C,
-                cv2.THRESH_BINARY,
-                block_size,
-                config.adaptive_c,
-            )
+            halo = block_size // 2
+
+            def threshold(image: np.ndarray) -> np.ndarray:
+                return cv2.adaptiveThreshold(
+                    _ensure_grayscale(image),
+                    255,
+                    cv2.ADAPTIVE_THRESH_MEAN_C,
+                    cv2.THRESH_BINARY,
+                    block_size,
+                    adaptive_c,
+                )
 
         case "ADAPTIVE_GAUSSIAN":
-            if config.adaptive_block_size % 2 == 1:
-                block_size = config.adaptive_block_size
-            else:
-                block_size = config.adaptive_block_size + 1
-
-            image = cv2.adaptiveThreshold(
-                image,
-                255,
-                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY,
-                block_size,
-                config.adaptive_c,
-            )
+            halo = block_size // 2
+
+            def threshold(image: np.ndarray) -> np.ndarray:
+                return cv2.adaptiveThreshold(
+                    _ensure_grayscale(image),
+                    255,
+                    cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                    cv2.THRESH_BINARY,
+                    block_size,
+                    adaptive_c,
+                )
 
-    return image
+        case _:
+            return [_local(_ensure_grayscale, 0)]
 
+    if halo is None:
+        return [threshold]
+
+    return [_local(threshold, halo)]
+
+
+def _compile_advanced_morphology(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_advanced_morphology(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.tophat:
         tophat_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.tophat_kernel_size, config.tophat_kernel_size),
         )
-        image = cv2.morphologyEx(image, cv2.MORPH_TOPHAT, tophat_kernel)
+
+        def tophat(image: np.ndarray) -> np.ndarray:
+            return cv2.morphologyEx(image, cv2.MORPH_TOPHAT, tophat_kernel)
+
+        operations.append(_local(tophat, config.tophat_kernel_size))
 
     if config.blackhat:
         blackhat_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.blackhat_kernel_size, config.blackhat_kernel_size),
         )
-        image = cv2.morphologyEx(image, cv2.MORPH_BLACKHAT, blackhat_kernel)
+
+        def blackhat(image: np.ndarray) -> np.ndarray:
+            return cv2.morphologyEx(image, cv2.MORPH_BLACKHAT, blackhat_kernel)
+
+        operations.append(_local(blackhat, config.blackhat_kernel_size))
+
+    gradient_kernel = None
 
     if config.gradient:
         gradient_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.gradient_kernel_size, config.gradient_kernel_size),
         )
-        image = cv2.morphologyEx(image, cv2.MORPH_GRADIENT, gradient_kernel)
     elif config.morphological_gradient:
-        morph_kernel = cv2.getStructuringElement(
+        gradient_kernel = cv2.getStructuringElement(
             cv2.MORPH_ELLIPSE,
             (config.morphological_gradient_kernel, config.morphological_gradient_kernel),
         )
-        image = cv2.morphologyEx(image, cv2.MORPH_GRADIENT, morph_kernel)
 
-    return image
+    if gradient_kernel is not None:
+
+        def gradient(image: np.ndarray) -> np.ndarray:
+            return cv2.morphologyEx(image, cv2.MORPH_GRADIENT, gradient_kernel)
 
+        operations.append(_local(gradient, gradient_kernel.shape[0]))
+
+    return operations
+
+
+def _compile_contour_filtering(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_contour_filtering(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.contour_filtering:
-        binary_image = _ensure_binary(image)
-        contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        mask = np.zeros_like(image)
-        fill_white = 255 if len(image.shape) == 2 else (255, 255, 255)
+        contour_area_min = config.contour_area_min
+        contour_area_max = config.contour_area_max
+
+        def contour_filtering(image: np.ndarray) -> np.ndarray:
+            binary_image = _ensure_binary(image)
+            contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            mask = np.zeros_like(image)
+            fill_white = 255 if len(image.shape) == 2 else (255, 255, 255)
+
+            for contour in contours:
+                area = cv2.contourArea(contour)
 
-        for contour in contours:
-            area = cv2.contourArea(contour)
+                if contour_area_min <= area <= contour_area_max:
+                    cv2.drawContours(mask, [contour], -1, fill_white, -1)
 
-            if config.contour_area_min <= area <= config.contour_area_max:
-                cv2.drawContours(mask, [contour], -1, fill_white, -1)
+            return cv2.bitwise_and(image, mask)
 
-        image = cv2.bitwise_and(image, mask)
+        operations.append(contour_filtering)
 
     if config.connected_components_filtering:
-        binary_image = _ensure_binary(image)
-        num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(binary_image, connectivity=8)
-        mask = np.zeros_like(image)
+        cc_min_area = config.cc_min_area
+        cc_max_area = config.cc_max_area
 
-        for i in range(1, num_labels):
-            area = stats[i, cv2.CC_STAT_AREA]
+        def connected_components_filtering(image: np.ndarray) -> np.ndarray:
+            binary_image = _ensure_binary(image)
+            num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(binary_image, connectivity=8)
+            mask = np.zeros_like(image)
 
-            if config.cc_min_area <= area <= config.cc_max_area:
-                mask[labels == i] = 255
+            for i in range(1, num_labels):
+                area = stats[i, cv2.CC_STAT_AREA]
 
-        image = mask
+                if cc_min_area <= area <= cc_max_area:
+                    mask[labels == i] = 255
+
+            return mask
+
+        operations.append(connected_components_filtering)
 
     if config.aspect_ratio_filtering:
-        binary_image = _ensure_binary(image)
-        contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        mask = np.zeros_like(image)
-        fill_white = 255 if len(image.shape) == 2 else (255, 255, 255)
+        min_aspect_ratio = config.min_aspect_ratio
+        max_aspect_ratio = config.max_aspect_ratio
 
-        for contour in contours:
-            _, _, w, h = cv2.boundingRect(contour)
-            aspect_ratio = w / h if h > 0 else 0
+        def aspect_ratio_filtering(image: np.ndarray) -> np.ndarray:
+            binary_image = _ensure_binary(image)
+            contours, _ = cv2.findContours(binary_image, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            mask = np.zeros_like(image)
+            fill_white = 255 if len(image.shape) == 2 else (255, 255, 255)
 
-            if config.min_aspect_ratio <= aspect_ratio <= config.max_aspect_ratio:
-                cv2.drawContours(mask, [contour], -1, fill_white, -1)
+            for contour in contours:
+                _, _, w, h = cv2.boundingRect(contour)
+                aspect_ratio = w / h if h > 0 else 0
 
-        image = cv2.bitwise_and(image, mask)
+                if min_aspect_ratio <= aspect_ratio <= max_aspect_ratio:
+                    cv2.drawContours(mask, [contour], -1, fill_white, -1)
 
-    return image
+            return cv2.bitwise_and(image, mask)
+
+        operations.append(aspect_ratio_filtering)
 
+    return operations
+
+
+def _compile_advanced_operations(config: ProcessingConfig) -> list[Operation]:
+    operations: list[Operation] = []
 
-def _apply_advanced_operations(image: np.ndarray, config: ProcessingConfig) -> np.ndarray:
     if config.hough_lines_removal:
-        gray_for_hough = _ensure_grayscale(image)
-        lines = cv2.HoughLinesP(
-            gray_for_hough,
-            1,
-            np.pi / 180,
-            config.hough_threshold,
-            minLineLength=config.hough_min_line_length,
-            maxLineGap=config.hough_max_line_gap,
-        )
+        hough_threshold = config.hough_threshold
+        hough_min_line_length = config.hough_min_line_length
+        hough_max_line_gap = config.hough_max_line_gap
+
+        def hough_lines_removal(image: np.ndarray) -> np.ndarray:
+            gray_for_hough = _ensure_grayscale(image)
+            lines = cv2.HoughLinesP(
+                gray_for_hough,
+                1,
+                np.pi / 180,
+                hough_threshold,
+                minLineLength=hough_min_line_length,
+                maxLineGap=hough_max_line_gap,
+            )
 
-        if lines is not None:
-            line_color = 0 if len(image.shape) == 2 else (0, 0, 0)
-            for line in lines:
-                coords = line.flatten()
-                x1, y1, x2, y2 = int(coords[0]), int(coords[1]), int(coords[2]), int(coords[3])
-                cv2.line(image, (x1, y1), (x2, y2), line_color, 2)
+            if lines is not None:
+                line_color = 0 if len(image.shape) == 2 else (0, 0, 0)
+                image = image.copy()
+                for line in lines:
+                    coords = line.flatten()
+                    x1, y1, x2, y2 = int(coords[0]), int(coords[1]), int(coords[2]), int(coords[3])
+                    cv2.line(image, (x1, y1), (x2, y2), line_color, 2)
+
+            return image
+
+        operations.append(hough_lines_removal)
 
     if config.intensity_normalization:
-        image = cv2.normalize(image, image, config.norm_min, config.norm_max, cv2.NORM_MINMAX)
+        norm_min = config.norm_min
+        norm_max = config.norm_max
+
+        def intensity_normalization(image: np.ndarray) -> np.ndarray:
+            return cv2.normalize(image, None, norm_min, norm_max, cv2.NORM_MINMAX)
+
+        operations.append(intensity_normalization)
 
     if config.contrast_stretching:
-        p_min = float(np.percentile(image.astype(np.float64), config.stretch_min_percentile))
-        p_max = float(np.percentile(image.astype(np.float64), config.stretch_max_percentile))
-        image = np.clip((image - p_min) * 255 / (p_max - p_min), 0, 255).astype(np.uint8)
+        stretch_min_percentile = config.stretch_min_percentile
+        stretch_max_percentile = config.stretch_max_percentile
+
+        def contrast_stretching(image: np.ndarray) -> np.ndarray:
+            p_min = float(np.percentile(image.astype(np.float64), stretch_min_percentile))
+            p_max = float(np.percentile(image.astype(np.float64), stretch_max_percentile))
+            return np.clip((image - p_min) * 255 / (p_max - p_min), 0, 255).astype(np.uint8)
+
+        operations.append(contrast_stretching)
 
     if config.distance_transform:
-        binary_image = _ensure_binary(image)
-        image = cv2.distanceTransform(binary_image, config.distance_transform_type, 3)
-        image = cv2.normalize(image, image, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        distance_type = config.distance_transform_type
+
+        def distance_transform(image: np.ndarray) -> np.ndarray:
+            binary_image = _ensure_binary(image)
+            image = cv2.distanceTransform(binary_image, distance_type, 3)
+            return cv2.normalize(image, image, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+
+        operations.append(distance_transform)
 
     if config.skeletonize:
-        binary_image = _ensure_binary(image)
-        image = _apply_skeletonization(binary_image)
+
+        def skeletonize(image: np.ndarray) -> np.ndarray:
+            return _apply_skeletonization(_ensure_binary(image))
+
+        operations.append(skeletonize)
 
     if config.watershed_markers:
-        binary_image = _ensure_binary(image)
-        image = _apply_watershed_markers(binary_image)
+
+        def watershed_markers(image: np.ndarray) -> np.ndarray:
+            return _apply_watershed_markers(_ensure_binary(image))
+
+        operations.append(watershed_markers)
 
     if config.local_binary_pattern:
         from skimage.feature import local_binary_pattern
 
-        gray_image = _ensure_grayscale(image)
-        lbp = local_binary_pattern(gray_image, config.lbp_n_points, config.lbp_radius, method="uniform")
+        lbp_n_points = config.lbp_n_points
+        lbp_radius = config.lbp_radius
 
-        if lbp.max() > 0:
-            image = (lbp * (255.0 / lbp.max())).astype(np.uint8)
-        else:
-            image = lbp.astype(np.uint8)
+        def apply_local_binary_pattern(image: np.ndarray) -> np.ndarray:
+            gray_image = _ensure_grayscale(image)
+            lbp = local_binary_pattern(gray_image, lbp_n_points, lbp_radius, method="uniform")
 
-    return image
+            if lbp.max() > 0:
+                return (lbp * (255.0 / lbp.max())).astype(np.uint8)
+
+            return lbp.astype(np.uint8)
+
+        operations.append(apply_local_binary_pattern)
+
+    return operations
 
 
 def _apply_skeletonization(image: np.ndarray) -> np.ndarray:
@@ -674,3 +1131,161 @@ def _apply_watershed_markers(image: np.ndarray) -> np.ndarray:
     sure_fg = sure_fg.astype(np.uint8)
 
     return cv2.subtract(sure_bg, sure_fg)
+
+
+_STAGES: tuple[tuple[Callable[[ProcessingConfig], list[Operation]], tuple[str, ...]], ...] = (
+    (_compile_input_normalization, ()),
+    (_compile_trim_borders, ("trim_borders_enabled", "trim_borders_tolerance")),
+    (_compile_resize, ("resize_enabled", "resize_width", "resize_height", "resize_maintain_aspect_ratio")),
+    (_compile_crop, ("crop_enabled", "bbox")),
+    (_compile_color_space, ("color_space",)),
+    (_compile_deskew, ("deskew_enabled", "deskew_method")),
+    (_compile_gamma_correction, ("gamma_correction", "gamma_value")),
+    (
+        _compile_denoising,
+        (
+            "denoise_nl_means",
+            "denoise_h",
+            "denoise_template_window",
+            "denoise_search_window",
+            "edge_preserving_filter",
+            "edge_filter_flags",
+            "edge_sigma_s",
+            "edge_sigma_r",
+            "noise_reduction_bilateral",
+            "noise_reduction_d",
+            "bilateral_iterations",
+        ),
+    ),
+    (
+        _compile_filters,
+        (
+            "bilateral_filter",
+            "bilateral_d",
+            "bilateral_sigma_color",
+            "bilateral_sigma_space",
+            "gaussian_blur",
+            "gaussian_kernel",
+            "gaussian_sigma",
+            "median_filter",
+            "median_kernel",
+            "background_subtraction",
+            "bg_kernel_size",
+            "bg_threshold",
+        ),
+    ),
+    (
+        _compile_histogram_operations,
+        (
+            "histogram_equalization",
+            "clahe",
+            "clahe_clip_limit",
+            "clahe_tile_size",
+            "adaptive_hist_eq",
+            "adaptive_hist_kernel",
+            "multi_otsu",
+            "multi_otsu_classes",
+        ),
+    ),
+    (
+        _compile_line_removal,
+        ("vertical_line_removal", "vertical_kernel_size", "horizontal_line_removal", "horizontal_kernel_size"),
+    ),
+    (
+        _compile_morphological_operations,
+        (
+            "stroke_width_normalization",
+            "stroke_iterations",
+            "morphology",
+            "morph_kernel_size",
+            "morph_open",
+            "morph_close",
+        ),
+    ),
+    (
+        _compile_character_operations,
+        (
+            "character_separation",
+            "char_sep_kernel_size",
+            "character_dilation",
+            "dilation_kernel_size",
+            "dilation_iterations",
+            "character_erosion",
+            "erosion_kernel_size",
+            "erosion_iterations",
+            "noise_dots_removal",
+            "min_contour_area",
+        ),
+    ),
+    (
+        _compile_enhancement_operations,
+        (
+            "text_enhancement",
+            "text_kernel_size",
+            "detail_enhancement",
+            "detail_sigma_s",
+            "detail_sigma_r",
+            "edge_enhancement",
+            "edge_strength",
+            "unsharp_mask",
+            "unsharp_sigma",
+            "unsharp_strength",
+            "sharpen",
+            "sharpen_strength",
+        ),
+    ),
+    (
+        _compile_threshold,
+        ("threshold_enabled", "threshold_type", "threshold_value", "adaptive_block_size", "adaptive_c"),
+    ),
+    (_compile_invert, ("invert_colors",)),
+    (
+        _compile_advanced_morphology,
+        (
+            "tophat",
+            "tophat_kernel_size",
+            "blackhat",
+            "blackhat_kernel_size",
+            "gradient",
+            "gradient_kernel_size",
+            "morphological_gradient",
+            "morphological_gradient_kernel",
+        ),
+    ),
+    (
+        _compile_contour_filtering,
+        (
+            "contour_filtering",
+            "contour_area_min",
+            "contour_area_max",
+            "connected_components_filtering",
+            "cc_min_area",
+            "cc_max_area",
+            "aspect_ratio_filtering",
+            "min_aspect_ratio",
+            "max_aspect_ratio",
+        ),
+    ),
+    (
+        _compile_advanced_operations,
+        (
+            "hough_lines_removal",
+            "hough_threshold",
+            "hough_min_line_length",
+            "hough_max_line_gap",
+            "intensity_normalization",
+            "norm_min",
+            "norm_max",
+            "contrast_stretching",
+            "stretch_min_percentile",
+            "stretch_max_percentile",
+            "distance_transform",
+            "distance_transform_type",
+            "skeletonize",
+            "watershed_markers",
+            "local_binary_pattern",
+            "lbp_radius",
+            "lbp_n_points",
+        ),
+    ),
+)
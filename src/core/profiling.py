@@ -0,0 +1,104 @@
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+def stop_memory_tracing() -> None:
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@dataclass(frozen=True)
+class OperationProfile:
+    stage: str
+    operation: str
+    seconds: float
+    shape: tuple[int, ...]
+    dtype: str
+    nbytes: int
+    peak_bytes: int | None = None
+    cached: bool = False
+
+
+@dataclass
+class ProcessingProfile:
+    trace_memory: bool = False
+    operations: list[OperationProfile] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(operation.seconds for operation in self.operations)
+
+    def measure(
+        self,
+        stage: str,
+        operation: Callable[[np.ndarray], np.ndarray],
+        image: np.ndarray,
+    ) -> np.ndarray:
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        result = operation(image)
+        seconds = time.perf_counter() - start
+
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline if self.trace_memory else None
+
+        self.operations.append(
+            OperationProfile(
+                stage,
+                getattr(operation, "__name__", repr(operation)),
+                seconds,
+                result.shape,
+                result.dtype.name,
+                result.nbytes,
+                peak_bytes,
+            ),
+        )
+
+        return result
+
+    def record_cached(self, stage: str, image: np.ndarray) -> None:
+        self.operations.append(
+            OperationProfile(stage, "cached", 0.0, image.shape, image.dtype.name, image.nbytes, cached=True),
+        )
+
+    def stage_seconds(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+
+        for operation in self.operations:
+            totals[operation.stage] = totals.get(operation.stage, 0.0) + operation.seconds
+
+        return totals
+
+    def slowest(self) -> OperationProfile | None:
+        return max(self.operations, key=lambda operation: operation.seconds, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": self.total_seconds,
+            "stages": self.stage_seconds(),
+            "operations": [asdict(operation) for operation in self.operations],
+        }
+
+    def format(self) -> str:
+        lines = [f"{'Stage':<24}{'Operation':<30}{'Time (ms)':>11}{'Output':>20}{'MiB':>9}{'Peak MiB':>10}"]
+
+        for operation in self.operations:
+            shape = "×".join(map(str, operation.shape))
+            peak = "" if operation.peak_bytes is None else f"{operation.peak_bytes / 2**20:.1f}"
+            lines.append(
+                f"{operation.stage:<24}{operation.operation:<30}{operation.seconds * 1000:>11.1f}"
+                f"{f'{shape} {operation.dtype}':>20}{operation.nbytes / 2**20:>9.1f}{peak:>10}",
+            )
+
+        lines.append(f"{'Total':<54}{self.total_seconds * 1000:>11.1f}")
+        return "\n".join(lines)
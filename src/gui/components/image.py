@@ -7,6 +7,7 @@ import cv2
 import numpy as np
 from PIL import Image, ImageTk
 
+from src.core.profiling import ProcessingProfile
 from src.gui.utils import create_button, create_labeled_frame
 
 
@@ -18,6 +19,7 @@ class ImagePanel:
         self.app = app
 
         self.zoom_factor: float = 1.0
+        self.image_scale: float = 1.0
         self.pan_x: int = 0
         self.pan_y: int = 0
         self.photo_ref: ImageTk.PhotoImage | None = None
@@ -29,16 +31,19 @@ class ImagePanel:
         self._last_canvas_width: int = 0
         self._last_canvas_height: int = 0
         self._cursor_text_id: int | None = None
+        self._region_start: tuple[int, int] | None = None
 
         self._initialize_state()
         self._create_frame()
 
-    def update_image(self, image: np.ndarray) -> None:
-        """Update displayed image"""
+    def update_image(self, image: np.ndarray, scale: float = 1.0) -> None:
+        """Update displayed image, where scale is its size relative to the full-resolution result"""
         if image is None:
             self._clear_display()
             return
 
+        self.image_scale = scale
+
         try:
             self._update_image_info(image)
             self._display_image(image)
@@ -46,6 +51,20 @@ class ImagePanel:
         except Exception as exception:
             self.status_label.config(text=f"Display error: {exception}", foreground="red")
 
+    def update_profile(self, profile: ProcessingProfile | None) -> None:
+        """Show total processing time and the slowest operation of profile"""
+        if profile is None:
+            self.profile_label.config(text="")
+            return
+
+        text = f"⏱ {profile.total_seconds * 1000:.0f} ms"
+        slowest = profile.slowest()
+
+        if slowest is not None and not slowest.cached:
+            text += f" (slowest: {slowest.stage}/{slowest.operation} {slowest.seconds * 1000:.0f} ms)"
+
+        self.profile_label.config(text=text)
+
     def zoom_in(self) -> None:
         """Zoom in on image"""
         old_zoom = self.zoom_factor
@@ -81,7 +100,7 @@ class ImagePanel:
         canvas_width = self.canvas.winfo_width() or 600
         canvas_height = self.canvas.winfo_height() or 400
 
-        img_h, img_w = self.app.processed_image.shape[:2]
+        img_h, img_w = self._get_full_resolution_size(self.app.processed_image)
 
         margin = 50
         zoom_w = (canvas_width - margin) / img_w
@@ -93,9 +112,31 @@ class ImagePanel:
 
         self._display_image(self.app.processed_image)
 
+    def draw_ocr_regions(self) -> None:
+        """Outline OCR regions on the displayed image"""
+        self.canvas.delete("ocr_region")
+        bounds = self._get_image_bounds()
+
+        if bounds is None:
+            return
+
+        left, top = bounds[:2]
+
+        for x1, y1, x2, y2 in self.app.ocr_config.regions:
+            self.canvas.create_rectangle(
+                left + x1 * self.zoom_factor,
+                top + y1 * self.zoom_factor,
+                left + x2 * self.zoom_factor,
+                top + y2 * self.zoom_factor,
+                outline="orange",
+                width=2,
+                tags="ocr_region",
+            )
+
     def _initialize_state(self) -> None:
         """Initialize image display state"""
         self.zoom_factor = 1.0
+        self.image_scale = 1.0
         self.pan_x = 0
         self.pan_y = 0
         self.photo_ref = None
@@ -180,6 +221,10 @@ class ImagePanel:
 
         self.canvas.bind("<Double-Button-1>", self._on_double_click)
 
+        self.canvas.bind("<Shift-Button-1>", self._start_region)
+        self.canvas.bind("<Shift-B1-Motion>", self._draw_region)
+        self.canvas.bind("<Shift-ButtonRelease-1>", self._finish_region)
+
         self.canvas.bind("<Enter>", self._on_canvas_enter)
         self.canvas.bind("<Leave>", self._on_canvas_leave)
 
@@ -215,7 +260,7 @@ class ImagePanel:
 
         image_x, image_y = self._canvas_to_image_coordinates(canvas_x, canvas_y)
 
-        img_height, img_width = self.app.processed_image.shape[:2]
+        img_height, img_width = self._get_full_resolution_size(self.app.processed_image)
 
         if image_x >= 0 and image_y >= 0 and image_x < img_width and image_y < img_height:
             self._update_cursor_text(f"({image_x}, {image_y})")
@@ -311,6 +356,59 @@ class ImagePanel:
         """Handle double click to reset zoom and pan"""
         self.reset_zoom()
 
+    def _start_region(self, event) -> None:
+        """Start drawing an OCR region"""
+        if self.app.processed_image is None:
+            return
+
+        self._region_start = (event.x, event.y)
+        self.canvas.create_rectangle(
+            event.x,
+            event.y,
+            event.x,
+            event.y,
+            outline="orange",
+            dash=(4, 2),
+            tags="region_draft",
+        )
+
+    def _draw_region(self, event) -> None:
+        """Resize the OCR region being drawn"""
+        if self._region_start is not None:
+            self.canvas.coords("region_draft", *self._region_start, event.x, event.y)
+
+    def _finish_region(self, event) -> None:
+        """Add the drawn region to OCR regions in full-resolution image coordinates"""
+        self.canvas.delete("region_draft")
+        start, self._region_start = self._region_start, None
+        bounds = self._get_image_bounds()
+
+        if start is None or bounds is None or self.app.processed_image is None:
+            return
+
+        left, top = bounds[:2]
+        img_height, img_width = self._get_full_resolution_size(self.app.processed_image)
+
+        xs = sorted(min(max(int((x - left) / self.zoom_factor), 0), img_width) for x in (start[0], event.x))
+        ys = sorted(min(max(int((y - top) / self.zoom_factor), 0), img_height) for y in (start[1], event.y))
+
+        if xs[1] - xs[0] >= 4 and ys[1] - ys[0] >= 4:
+            self.app.add_ocr_region((xs[0], ys[0], xs[1], ys[1]))
+
+    def _get_image_bounds(self) -> tuple[int, int, int, int] | None:
+        """Get left, top, width and height of the displayed image on canvas"""
+        if self.app.processed_image is None:
+            return None
+
+        img_height, img_width = self._get_full_resolution_size(self.app.processed_image)
+        width = max(1, int(img_width * self.zoom_factor))
+        height = max(1, int(img_height * self.zoom_factor))
+
+        left = self.image_center_x + self.pan_x - width // 2
+        top = self.image_center_y + self.pan_y - height // 2
+
+        return left, top, width, height
+
     def _create_status_section(self, parent: ttk.Frame) -> None:
         """Create status information section"""
         status_frame = ttk.Frame(parent)
@@ -322,6 +420,9 @@ class ImagePanel:
         self.image_info_label = ttk.Label(status_frame, text="", foreground="blue")
         self.image_info_label.pack(side=tk.LEFT, padx=(20, 0))
 
+        self.profile_label = ttk.Label(status_frame, text="", foreground="purple")
+        self.profile_label.pack(side=tk.LEFT, padx=(20, 0))
+
     def _create_zoom_controls(self, parent: ttk.Frame) -> None:
         """Create zoom control buttons"""
         zoom_frame = ttk.Frame(parent)
@@ -342,10 +443,20 @@ class ImagePanel:
         self._cursor_text_id = None
         self.status_label.config(text="No image loaded", foreground="gray")
         self.image_info_label.config(text="")
+        self.profile_label.config(text="")
+
+    def _get_full_resolution_size(self, image: np.ndarray) -> tuple[int, int]:
+        """Get height and width of the full-resolution result that image stands in for"""
+        h, w = image.shape[:2]
+
+        if self.image_scale == 1.0:
+            return h, w
+
+        return round(h / self.image_scale), round(w / self.image_scale)
 
     def _update_image_info(self, image: np.ndarray) -> None:
         """Update image information display"""
-        h, w = image.shape[:2]
+        h, w = self._get_full_resolution_size(image)
         channels = image.shape[2] if len(image.shape) == 3 else 1
 
         unique_values = np.unique(image)
@@ -362,7 +473,11 @@ class ImagePanel:
             info_text = f"{w}×{h}px ({channels} channels)"
 
         self.image_info_label.config(text=info_text, foreground="blue")
-        self.status_label.config(text="Image loaded", foreground="green")
+
+        if self.image_scale < 1.0:
+            self.status_label.config(text=f"Preview ({int(self.image_scale * 100)}%)", foreground="orange")
+        else:
+            self.status_label.config(text="Image loaded", foreground="green")
 
     def _display_image(self, image: np.ndarray) -> None:
         """Display image on canvas with clean positioning"""
@@ -410,6 +525,7 @@ class ImagePanel:
 
         self._update_scroll_region(display_image, image_x, image_y)
         self._update_zoom_display()
+        self.draw_ocr_regions()
 
         if saved_cursor_text:
             self._update_cursor_text(saved_cursor_text)
@@ -421,12 +537,14 @@ class ImagePanel:
         else:
             display_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-        if self.zoom_factor == 1.0:
+        display_factor = self.zoom_factor / self.image_scale
+
+        if display_factor == 1.0:
             return display_image
 
         orig_h, orig_w = display_image.shape[:2]
-        new_w = max(1, int(orig_w * self.zoom_factor))
-        new_h = max(1, int(orig_h * self.zoom_factor))
+        new_w = max(1, int(orig_w * display_factor))
+        new_h = max(1, int(orig_h * display_factor))
 
         max_dimension = 8000
         if new_w > max_dimension or new_h > max_dimension:
@@ -435,7 +553,7 @@ class ImagePanel:
             new_h = int(new_h * scale)
             self.zoom_factor *= scale
 
-        if self.zoom_factor > 1.0:
+        if display_factor > 1.0:
             interpolation = cv2.INTER_CUBIC
         else:
             interpolation = cv2.INTER_AREA
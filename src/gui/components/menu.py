@@ -1,6 +1,6 @@
 import sys
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, simpledialog
 from typing import Any
 
 ABOUT_TEXT: str = """Image Lab - Computer Vision Toolkit
@@ -136,6 +136,31 @@ class MenuBar:
         view_menu.add_separator()
 
         view_menu.add_command(label="Fit to Window", command=self._fit_to_window, accelerator=f"{mod}+F")
+        view_menu.add_separator()
+
+        self.preview_var = tk.BooleanVar(value=self.app.preview_enabled)
+        view_menu.add_checkbutton(
+            label="Low-Resolution Preview",
+            variable=self.preview_var,
+            command=self._toggle_preview,
+        )
+
+        self.profiling_var = tk.BooleanVar(value=self.app.profiling_enabled)
+        view_menu.add_checkbutton(
+            label="Profile Processing",
+            variable=self.profiling_var,
+            command=self._toggle_profiling,
+        )
+        view_menu.add_command(label="Processing Report...", command=self.app.show_processing_report)
+        view_menu.add_separator()
+
+        self.disk_cache_var = tk.BooleanVar(value=self.app.disk_cache_enabled)
+        view_menu.add_checkbutton(
+            label="Persistent Cache",
+            variable=self.disk_cache_var,
+            command=self._toggle_disk_cache,
+        )
+        view_menu.add_command(label="Persistent Cache Size...", command=self._set_disk_cache_size)
 
     def _zoom_in(self) -> None:
         """Zoom in on image"""
@@ -157,6 +182,32 @@ class MenuBar:
         if hasattr(self.app, "image_panel"):
             self.app.image_panel.fit_to_window()
 
+    def _toggle_preview(self) -> None:
+        """Toggle low-resolution preview"""
+        self.app.set_preview_enabled(self.preview_var.get())
+
+    def _toggle_profiling(self) -> None:
+        """Toggle per-operation processing profiling"""
+        self.app.set_profiling_enabled(self.profiling_var.get())
+
+    def _toggle_disk_cache(self) -> None:
+        """Toggle keeping results on disk between sessions"""
+        self.app.set_disk_cache_enabled(self.disk_cache_var.get())
+        self.disk_cache_var.set(self.app.disk_cache_enabled)
+
+    def _set_disk_cache_size(self) -> None:
+        """Ask for the persistent cache size limit"""
+        size_mb = simpledialog.askinteger(
+            "Persistent Cache Size",
+            f"Maximum size of {self.app.cache_dir} in MiB:",
+            initialvalue=self.app.disk_cache_max_bytes // (1024 * 1024),
+            minvalue=64,
+            parent=self.parent,
+        )
+
+        if size_mb is not None:
+            self.app.set_disk_cache_max_bytes(size_mb * 1024 * 1024)
+
     def _create_help_menu(self) -> None:
         """Create Help menu"""
         help_menu = tk.Menu(self.menu, tearoff=0)
@@ -2,8 +2,11 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Any
 
+from src.core.ocr import get_available_ocr_backends, get_ocr_backends
+from src.core.ocr_result import OCRResult
 from src.gui.utils import (
     create_button,
+    create_checkbox,
     create_combobox,
     create_labeled_frame,
     create_scrollable_frame,
@@ -22,33 +25,33 @@ class OCRPanel:
         self._setup_variables()
         self._create_frame()
 
-    def display_results(self, result) -> None:
+    def display_results(self, result: OCRResult) -> None:
         """Display OCR results"""
         self.result_text.delete(1.0, tk.END)
 
-        if result and result[0] and "rec_texts" in result[0]:
-            texts = result[0]["rec_texts"]
-            confidence_scores = result[0].get("rec_scores", [])
-            min_conf = self.min_confidence_var.get() / 100.0
-
-            formatted_results = []
+        if not len(result):
+            self.result_text.insert(tk.END, "No text detected")
+            return
 
-            for i, text in enumerate(texts):
-                if i < len(confidence_scores):
-                    score = confidence_scores[i]
-                    if score < min_conf:
-                        continue
-                    confidence = score * 100
-                    formatted_results.append(f"{text} ({confidence:.1f}%)")
-                else:
-                    if min_conf > 0:
-                        continue
-                    formatted_results.append(text)
+        filtered = result.filter(self.min_confidence_var.get() / 100.0)
+        confidences = filtered.scores * 100
+        formatted_results = [f"{text} ({confidence:.1f}%)" for text, confidence in zip(filtered.texts, confidences)]
 
-            self.result_text.insert(tk.END, "\n".join(formatted_results))
+        self.result_text.insert(tk.END, "\n".join(formatted_results))
 
+    def set_running(self, running: bool, status: str = "") -> None:
+        """Switch action button between running and cancelling OCR and show status"""
+        if running:
+            self.ocr_button.configure(text="⏹ Cancel OCR", command=self.app.cancel_ocr)
         else:
-            self.result_text.insert(tk.END, "No text detected")
+            self.ocr_button.configure(text="🔍 Run OCR", command=self.app.run_ocr)
+
+        self.status_label.configure(text=status)
+
+    def update_regions(self) -> None:
+        """Show how many regions OCR is restricted to"""
+        count = len(self.app.ocr_config.regions)
+        self.regions_label.configure(text=f"Regions: {count}" if count else "Regions: whole image")
 
     def refresh(self) -> None:
         """Refresh panel with current configuration"""
@@ -56,6 +59,9 @@ class OCRPanel:
 
         self.min_confidence_var.set(ocr_config.min_display_confidence_percent)
         self.ocr_type_var.set(ocr_config.ocr_type)
+        self.tiled_var.set(ocr_config.tiled)
+        self.tile_size_var.set(ocr_config.tile_size)
+        self.update_regions()
 
         if ocr_config.ocr_type == "paddleocr":
             paddle_config = ocr_config.paddleocr_config
@@ -142,6 +148,9 @@ class OCRPanel:
         ocr_config = self.app.ocr_config
 
         self.ocr_type_var = tk.StringVar(value=ocr_config.ocr_type)
+        self.warm_up_var = tk.BooleanVar(value=self.app.ocr_warm_up_enabled)
+        self.tiled_var = tk.BooleanVar(value=ocr_config.tiled)
+        self.tile_size_var = tk.IntVar(value=ocr_config.tile_size)
 
         paddle_config = ocr_config.paddleocr_config
         self.paddle_lang_var = tk.StringVar(value=paddle_config.lang)
@@ -239,6 +248,37 @@ class OCRPanel:
         self.ocr_button = create_button(button_frame, "🔍 Run OCR", self.app.run_ocr)
         self.ocr_button.pack(fill=tk.X, pady=2)
 
+        compare_button = create_button(button_frame, "⚖ Compare Engines", self.app.compare_ocr_engines)
+        compare_button.pack(fill=tk.X, pady=2)
+
+        warm_up_checkbox = create_checkbox(
+            action_frame,
+            "Warm up engine in background",
+            self.warm_up_var,
+            self._on_warm_up_changed,
+        )
+        warm_up_checkbox.pack(anchor=tk.W)
+
+        self.status_label = ttk.Label(action_frame, text="", foreground="gray")
+        self.status_label.pack(anchor=tk.W)
+
+        regions_frame = ttk.Frame(action_frame)
+        regions_frame.pack(fill=tk.X, pady=(5, 0))
+
+        self.regions_label = ttk.Label(regions_frame, text="")
+        self.regions_label.pack(side=tk.LEFT)
+
+        clear_button = create_button(regions_frame, "Clear", self.app.clear_ocr_regions)
+        clear_button.pack(side=tk.RIGHT)
+
+        crop_button = create_button(regions_frame, "Use Crop Box", self.app.use_crop_box_as_ocr_region)
+        crop_button.pack(side=tk.RIGHT, padx=(0, 5))
+
+        hint_label = ttk.Label(action_frame, text="Shift+drag on the image to add a region", foreground="gray")
+        hint_label.pack(anchor=tk.W)
+
+        self.update_regions()
+
     def _create_settings_section(self) -> None:
         """Create OCR settings section"""
         settings_frame = create_labeled_frame(self.frame, "⚙️ Settings")
@@ -255,11 +295,29 @@ class OCRPanel:
             scrollable_frame,
             "OCR Engine",
             self.ocr_type_var,
-            ["paddleocr", "tesseract", "easyocr", "rapidocr"],
+            get_available_ocr_backends() or get_ocr_backends(),
             self._on_ocr_type_changed,
         )
         ocr_type_frame.pack(fill=tk.X, pady=(0, 5))
 
+        tiled_checkbox = create_checkbox(
+            scrollable_frame,
+            "Tile large images",
+            self.tiled_var,
+            self._on_tiled_changed,
+        )
+        tiled_checkbox.pack(anchor=tk.W)
+
+        tile_size_frame, _ = create_spinbox(
+            scrollable_frame,
+            "Tile size",
+            self.tile_size_var,
+            320,
+            4096,
+            self._on_tile_size_changed,
+        )
+        tile_size_frame.pack(fill=tk.X, pady=(0, 5))
+
         self.paddleocr_frame = ttk.Frame(scrollable_frame)
         self._create_paddleocr_settings(self.paddleocr_frame)
 
@@ -900,119 +958,119 @@ class OCRPanel:
         """Handle OCR type change"""
         self.app.ocr_config.ocr_type = self.ocr_type_var.get()
         self._update_visible_settings()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_paddle_lang_changed(self, value) -> None:
         """Handle PaddleOCR language change"""
         self.app.ocr_config.paddleocr_config.lang = self.paddle_lang_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_device_changed(self, value) -> None:
         """Handle device change"""
         self.app.ocr_config.paddleocr_config.device = self.device_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_version_changed(self, value) -> None:
         """Handle version change"""
         self.app.ocr_config.paddleocr_config.ocr_version = self.version_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_det_thresh_changed(self, value) -> None:
         """Handle detection threshold change"""
         self.app.ocr_config.paddleocr_config.text_det_thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_box_thresh_changed(self, value) -> None:
         """Handle box threshold change"""
         self.app.ocr_config.paddleocr_config.text_det_box_thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_score_thresh_changed(self, value) -> None:
         """Handle score threshold change"""
         self.app.ocr_config.paddleocr_config.text_rec_score_thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_unclip_ratio_changed(self, value) -> None:
         """Handle unclip ratio change"""
         self.app.ocr_config.paddleocr_config.text_det_unclip_ratio = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_batch_size_changed(self) -> None:
         """Handle batch size change"""
         self.app.ocr_config.paddleocr_config.text_recognition_batch_size = self.batch_size_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_cpu_threads_changed(self) -> None:
         """Handle CPU threads change"""
         self.app.ocr_config.paddleocr_config.cpu_threads = self.cpu_threads_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_enable_hpi_changed(self) -> None:
         """Handle High Performance Inference checkbox change"""
         self.app.ocr_config.paddleocr_config.enable_hpi = self.enable_hpi_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_mkldnn_cache_changed(self) -> None:
         """Handle MKL-DNN Cache Capacity spinbox change"""
         self.app.ocr_config.paddleocr_config.mkldnn_cache_capacity = self.mkldnn_cache_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_precision_changed(self, value) -> None:
         """Handle Precision combobox change"""
         self.app.ocr_config.paddleocr_config.precision = self.precision_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_use_tensorrt_changed(self) -> None:
         """Handle TensorRT checkbox change"""
         self.app.ocr_config.paddleocr_config.use_tensorrt = self.use_tensorrt_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_enable_mkldnn_changed(self) -> None:
         """Handle MKL-DNN checkbox change"""
         self.app.ocr_config.paddleocr_config.enable_mkldnn = self.enable_mkldnn_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_textline_orientation_batch_changed(self) -> None:
         """Handle Textline Orientation Batch Size spinbox change"""
         self.app.ocr_config.paddleocr_config.textline_orientation_batch_size = self.textline_orientation_batch_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_det_limit_side_len_changed(self) -> None:
         """Handle Detection Limit Side Length spinbox change"""
         self.app.ocr_config.paddleocr_config.text_det_limit_side_len = self.det_limit_side_len_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_det_limit_type_changed(self, value) -> None:
         """Handle Detection Limit Type combobox change"""
         self.app.ocr_config.paddleocr_config.text_det_limit_type = self.det_limit_type_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_tesseract_lang_changed(self, value) -> None:
         """Handle Tesseract language change"""
         self.app.ocr_config.tesseract_config.lang = self.tesseract_lang_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_psm_changed(self) -> None:
         """Handle PSM change"""
         self.app.ocr_config.tesseract_config.psm = self.psm_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_oem_changed(self) -> None:
         """Handle OEM change"""
         self.app.ocr_config.tesseract_config.oem = self.oem_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_tesseract_config_changed(self, event) -> None:
         """Handle Tesseract config string change"""
         self.app.ocr_config.tesseract_config.config = self.tesseract_config_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_lang_changed(self, event) -> None:
         """Handle EasyOCR language change"""
         lang_str = self.easyocr_lang_var.get()
         lang_list = [lang.strip() for lang in lang_str.split(",") if lang.strip()]
         self.app.ocr_config.easyocr_config.lang_list = lang_list or ["en"]
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_gpu_changed(self) -> None:
         """Handle EasyOCR GPU change"""
@@ -1021,167 +1079,183 @@ class OCRPanel:
             self.app.ocr_config.easyocr_config.gpu = gpu_str or True
         else:
             self.app.ocr_config.easyocr_config.gpu = False
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_decoder_changed(self, value) -> None:
         """Handle EasyOCR decoder change"""
         self.app.ocr_config.easyocr_config.decoder = self.easyocr_decoder_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_beam_width_changed(self) -> None:
         """Handle EasyOCR beam width change"""
         self.app.ocr_config.easyocr_config.beam_width = self.easyocr_beam_width_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_batch_size_changed(self) -> None:
         """Handle EasyOCR batch size change"""
         self.app.ocr_config.easyocr_config.batch_size = self.easyocr_batch_size_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_workers_changed(self) -> None:
         """Handle EasyOCR workers change"""
         self.app.ocr_config.easyocr_config.workers = self.easyocr_workers_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_paragraph_changed(self) -> None:
         """Handle EasyOCR paragraph change"""
         self.app.ocr_config.easyocr_config.paragraph = self.easyocr_paragraph_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_min_size_changed(self) -> None:
         """Handle EasyOCR min size change"""
         self.app.ocr_config.easyocr_config.min_size = self.easyocr_min_size_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_text_threshold_changed(self, value) -> None:
         """Handle EasyOCR text threshold change"""
         self.app.ocr_config.easyocr_config.text_threshold = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_low_text_changed(self, value) -> None:
         """Handle EasyOCR low text change"""
         self.app.ocr_config.easyocr_config.low_text = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_link_threshold_changed(self, value) -> None:
         """Handle EasyOCR link threshold change"""
         self.app.ocr_config.easyocr_config.link_threshold = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_canvas_size_changed(self) -> None:
         """Handle EasyOCR canvas size change"""
         self.app.ocr_config.easyocr_config.canvas_size = self.easyocr_canvas_size_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_mag_ratio_changed(self, value) -> None:
         """Handle EasyOCR magnification ratio change"""
         self.app.ocr_config.easyocr_config.mag_ratio = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_contrast_ths_changed(self, value) -> None:
         """Handle EasyOCR contrast threshold change"""
         self.app.ocr_config.easyocr_config.contrast_ths = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_easyocr_adjust_contrast_changed(self, value) -> None:
         self.app.ocr_config.easyocr_config.adjust_contrast = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_lang_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.lang_type = self.rapidocr_lang_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_version_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.ocr_version = self.rapidocr_version_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_model_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.model_type = self.rapidocr_model_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_use_cls_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.use_cls = self.rapidocr_use_cls_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_text_score_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.text_score = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_limit_side_len_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.limit_side_len = self.rapidocr_limit_side_len_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_limit_type_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.limit_type = self.rapidocr_limit_type_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_thresh_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_box_thresh_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.box_thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_unclip_ratio_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.unclip_ratio = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_max_candidates_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.max_candidates = self.rapidocr_max_candidates_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_use_dilation_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.use_dilation = self.rapidocr_use_dilation_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_score_mode_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.score_mode = self.rapidocr_score_mode_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_cls_batch_num_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.cls_batch_num = self.rapidocr_cls_batch_num_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_cls_thresh_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.cls_thresh = round(float(value), 3)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_rec_batch_num_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.rec_batch_num = self.rapidocr_rec_batch_num_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_use_det_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.use_det = self.rapidocr_use_det_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_use_rec_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.use_rec = self.rapidocr_use_rec_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_min_height_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.min_height = self.rapidocr_min_height_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_width_height_ratio_changed(self, value) -> None:
         self.app.ocr_config.rapidocr_config.width_height_ratio = round(float(value), 2)
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_max_side_len_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.max_side_len = self.rapidocr_max_side_len_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
 
     def _on_rapidocr_min_side_len_changed(self) -> None:
         self.app.ocr_config.rapidocr_config.min_side_len = self.rapidocr_min_side_len_var.get()
-        self._invalidate_ocr_instance()
+        self._on_ocr_settings_changed()
+
+    def _on_ocr_settings_changed(self) -> None:
+        """Warm up the engine matching changed settings"""
+        self.app.schedule_ocr_warm_up()
 
-    def _invalidate_ocr_instance(self) -> None:
-        """Invalidate current OCR instance to force recreation"""
-        self.app.ocr_instance = None
+    def _on_warm_up_changed(self) -> None:
+        """Toggle background warm-up of the OCR engine"""
+        self.app.set_ocr_warm_up_enabled(self.warm_up_var.get())
+
+    def _on_tiled_changed(self) -> None:
+        """Toggle tiled OCR of images larger than the tile size"""
+        self.app.ocr_config.tiled = self.tiled_var.get()
+
+    def _on_tile_size_changed(self) -> None:
+        """Handle OCR tile size change"""
+        self.app.ocr_config.tile_size = self.tile_size_var.get()
 
     def _on_min_display_confidence_changed(self, *_args: object) -> None:
         self.app.ocr_config.min_display_confidence_percent = float(self.min_confidence_var.get())
 
+        # Confidence only filters what is shown, so the last result is re-filtered instead of running OCR again
+        if self.app.ocr_result is not None:
+            self.display_results(self.app.ocr_result)
+
     def _create_results_section(self) -> None:
         """Create OCR results section"""
         results_frame = create_labeled_frame(self.frame, "📄 Results")
@@ -333,7 +333,7 @@ class ProcessingPanel:
         self.app.processing_config.color_space = value
         self._update_grayscale_dependent_controls()
         self._update_binary_dependent_controls()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_preprocessing_section(self) -> None:
         """Create preprocessing section with resize, crop, and gamma correction"""
@@ -478,63 +478,63 @@ class ProcessingPanel:
     def _on_trim_borders_enabled_changed(self) -> None:
         self.app.processing_config.trim_borders_enabled = self.trim_borders_enabled_var.get()
         self._update_trim_borders_tolerance_visibility()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_trim_borders_tolerance_changed(self, value) -> None:
         self.app.processing_config.trim_borders_tolerance = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_resize_enabled_changed(self) -> None:
         """Handle resize enabled change"""
         self.app.processing_config.resize_enabled = self.resize_enabled_var.get()
         self._update_crop_status()
         self._update_resize_dependent_controls()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_resize_width_changed(self, value) -> None:
         """Handle resize width change"""
         self.app.processing_config.resize_width = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
         self._update_crop_status()
 
     def _on_resize_height_changed(self, value) -> None:
         """Handle resize height change"""
         self.app.processing_config.resize_height = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
         self._update_crop_status()
 
     def _on_resize_maintain_aspect_ratio_changed(self) -> None:
         """Handle maintain aspect ratio change"""
         self.app.processing_config.resize_maintain_aspect_ratio = self.resize_maintain_aspect_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gamma_correction_changed(self) -> None:
         """Handle gamma correction change"""
         self.app.processing_config.gamma_correction = self.gamma_correction_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gamma_value_changed(self, value) -> None:
         """Handle gamma value change"""
         self.app.processing_config.gamma_value = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_deskew_enabled_changed(self) -> None:
         self.app.processing_config.deskew_enabled = self.deskew_enabled_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_deskew_method_changed(self, value) -> None:
         self.app.processing_config.deskew_method = value
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_invert_colors_changed(self) -> None:
         self.app.processing_config.invert_colors = self.invert_colors_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_crop_enabled_changed(self) -> None:
         """Handle crop enabled change"""
         self.app.processing_config.crop_enabled = self.crop_enabled_var.get()
         self._update_crop_status()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _update_crop_status(self) -> None:
         if not self.crop_enabled_var.get():
@@ -640,7 +640,7 @@ class ProcessingPanel:
             self._update_crop_status()
 
             if x2 > x1 and y2 > y1:
-                self.app.update_image_display()
+                self.app.schedule_image_update()
         else:
             self._update_crop_status()
 
@@ -720,32 +720,32 @@ class ProcessingPanel:
         """Handle threshold enabled change"""
         self.app.processing_config.threshold_enabled = self.threshold_enabled_var.get()
         self._update_binary_dependent_controls()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_threshold_type_changed(self, value: str | None = None) -> None:
         """Handle threshold type change"""
         self.app.processing_config.threshold_type = self.threshold_type_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_threshold_value_changed(self, value) -> None:
         """Handle threshold value change"""
         self.app.processing_config.threshold_value = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_adaptive_block_size_changed(self, value) -> None:
         """Handle adaptive block size change"""
         self.app.processing_config.adaptive_block_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_adaptive_c_changed(self, value) -> None:
         """Handle adaptive C change"""
         self.app.processing_config.adaptive_c = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_multi_otsu_classes_changed(self, value) -> None:
         """Handle multi-OTSU classes change"""
         self.app.processing_config.multi_otsu_classes = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_noise_filters_section(self) -> None:
         """Create noise filters section"""
@@ -892,77 +892,77 @@ class ProcessingPanel:
     def _on_denoise_nl_means_changed(self) -> None:
         """Handle NL-means denoising change"""
         self.app.processing_config.denoise_nl_means = self.denoise_nl_means_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_denoise_h_changed(self, value) -> None:
         """Handle denoise H change"""
         self.app.processing_config.denoise_h = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_denoise_template_window_changed(self, value) -> None:
         """Handle denoise template window change"""
         self.app.processing_config.denoise_template_window = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_denoise_search_window_changed(self, value) -> None:
         """Handle denoise search window change"""
         self.app.processing_config.denoise_search_window = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_edge_preserving_filter_changed(self) -> None:
         """Handle edge preserving filter change"""
         self.app.processing_config.edge_preserving_filter = self.edge_preserving_filter_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_edge_sigma_s_changed(self, value) -> None:
         """Handle edge sigma S change"""
         self.app.processing_config.edge_sigma_s = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_edge_sigma_r_changed(self, value) -> None:
         """Handle edge sigma R change"""
         self.app.processing_config.edge_sigma_r = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_noise_reduction_bilateral_changed(self) -> None:
         """Handle noise reduction bilateral change"""
         self.app.processing_config.noise_reduction_bilateral = self.noise_reduction_bilateral_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_bilateral_iterations_changed(self, value) -> None:
         """Handle bilateral iterations change"""
         self.app.processing_config.bilateral_iterations = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_bilateral_filter_changed(self) -> None:
         """Handle bilateral filter change"""
         self.app.processing_config.bilateral_filter = self.bilateral_filter_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_bilateral_d_changed(self, value) -> None:
         """Handle bilateral d change"""
         self.app.processing_config.bilateral_d = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gaussian_blur_changed(self) -> None:
         """Handle gaussian blur change"""
         self.app.processing_config.gaussian_blur = self.gaussian_blur_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gaussian_kernel_changed(self, value) -> None:
         """Handle gaussian kernel change"""
         self.app.processing_config.gaussian_kernel = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_median_filter_changed(self) -> None:
         """Handle median filter change"""
         self.app.processing_config.median_filter = self.median_filter_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_median_kernel_changed(self, value) -> None:
         """Handle median kernel change"""
         self.app.processing_config.median_kernel = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_advanced_filters_section(self) -> None:
         """Create advanced filters section"""
@@ -1019,27 +1019,27 @@ class ProcessingPanel:
     def _on_bilateral_sigma_color_changed(self, value) -> None:
         """Handle bilateral sigma color change"""
         self.app.processing_config.bilateral_sigma_color = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_bilateral_sigma_space_changed(self, value) -> None:
         """Handle bilateral sigma space change"""
         self.app.processing_config.bilateral_sigma_space = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gaussian_sigma_changed(self, value) -> None:
         """Handle gaussian sigma change"""
         self.app.processing_config.gaussian_sigma = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_background_subtraction_changed(self) -> None:
         """Handle background subtraction change"""
         self.app.processing_config.background_subtraction = self.background_subtraction_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_bg_threshold_changed(self, value) -> None:
         """Handle background threshold change"""
         self.app.processing_config.bg_threshold = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_noise_reduction_section(self) -> None:
         """Create consolidated noise reduction section"""
@@ -1386,22 +1386,22 @@ class ProcessingPanel:
     def _on_clahe_changed(self) -> None:
         """Handle CLAHE change"""
         self.app.processing_config.clahe = self.clahe_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_clahe_clip_changed(self, value) -> None:
         """Handle CLAHE clip limit change"""
         self.app.processing_config.clahe_clip_limit = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_sharpen_changed(self) -> None:
         """Handle sharpen change"""
         self.app.processing_config.sharpen = self.sharpen_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_sharpen_strength_changed(self, value) -> None:
         """Handle sharpen strength change"""
         self.app.processing_config.sharpen_strength = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_advanced_enhancement_section(self) -> None:
         """Create advanced enhancement section"""
@@ -1482,42 +1482,42 @@ class ProcessingPanel:
     def _on_text_enhancement_changed(self) -> None:
         """Handle text enhancement change"""
         self.app.processing_config.text_enhancement = self.text_enhancement_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_text_kernel_size_changed(self, value) -> None:
         """Handle text kernel size change"""
         self.app.processing_config.text_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_detail_enhancement_changed(self) -> None:
         """Handle detail enhancement change"""
         self.app.processing_config.detail_enhancement = self.detail_enhancement_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_detail_sigma_s_changed(self, value) -> None:
         """Handle detail sigma S change"""
         self.app.processing_config.detail_sigma_s = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_detail_sigma_r_changed(self, value) -> None:
         """Handle detail sigma R change"""
         self.app.processing_config.detail_sigma_r = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_edge_strength_changed(self, value) -> None:
         """Handle edge strength change"""
         self.app.processing_config.edge_strength = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_unsharp_mask_changed(self) -> None:
         """Handle unsharp mask change"""
         self.app.processing_config.unsharp_mask = self.unsharp_mask_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_unsharp_strength_changed(self, value) -> None:
         """Handle unsharp strength change"""
         self.app.processing_config.unsharp_strength = float(value)
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_morphology_section(self) -> None:
         """Create consolidated morphology section"""
@@ -1789,77 +1789,77 @@ class ProcessingPanel:
     def _on_morph_open_changed(self) -> None:
         """Handle morphology open change"""
         self.app.processing_config.morph_open = self.morph_open_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_morph_close_changed(self) -> None:
         """Handle morphology close change"""
         self.app.processing_config.morph_close = self.morph_close_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_stroke_iterations_changed(self, value) -> None:
         """Handle stroke iterations change"""
         self.app.processing_config.stroke_iterations = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_tophat_kernel_size_changed(self, value) -> None:
         """Handle tophat kernel size change"""
         self.app.processing_config.tophat_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_blackhat_kernel_size_changed(self, value) -> None:
         """Handle blackhat kernel size change"""
         self.app.processing_config.blackhat_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gradient_kernel_size_changed(self, value) -> None:
         """Handle gradient kernel size change"""
         self.app.processing_config.gradient_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_morphological_gradient_changed(self) -> None:
         """Handle morphological gradient change"""
         self.app.processing_config.morphological_gradient = self.morphological_gradient_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_morphological_gradient_kernel_changed(self, value) -> None:
         """Handle morphological gradient kernel change"""
         self.app.processing_config.morphological_gradient_kernel = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_char_sep_kernel_size_changed(self, value) -> None:
         """Handle character separation kernel size change"""
         self.app.processing_config.char_sep_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_dilation_kernel_size_changed(self, value) -> None:
         """Handle dilation kernel size change"""
         self.app.processing_config.dilation_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_dilation_iterations_changed(self, value) -> None:
         """Handle dilation iterations change"""
         self.app.processing_config.dilation_iterations = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_erosion_kernel_size_changed(self, value) -> None:
         """Handle erosion kernel size change"""
         self.app.processing_config.erosion_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_erosion_iterations_changed(self, value) -> None:
         """Handle erosion iterations change"""
         self.app.processing_config.erosion_iterations = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_morphology_changed(self) -> None:
         """Handle morphology change"""
         self.app.processing_config.morphology = self.morphology_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_morph_kernel_changed(self, value) -> None:
         """Handle morphology kernel change"""
         self.app.processing_config.morph_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_histogram_advanced_section(self) -> None:
         """Create advanced histogram section"""
@@ -1893,17 +1893,17 @@ class ProcessingPanel:
     def _on_clahe_tile_size_changed(self, value) -> None:
         """Handle CLAHE tile size change"""
         self.app.processing_config.clahe_tile_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_intensity_normalization_changed(self) -> None:
         """Handle intensity normalization change"""
         self.app.processing_config.intensity_normalization = self.intensity_normalization_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_contrast_stretching_changed(self) -> None:
         """Handle contrast stretching change"""
         self.app.processing_config.contrast_stretching = self.contrast_stretching_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_line_removal_advanced_section(self) -> None:
         """Create advanced line removal section"""
@@ -1940,17 +1940,17 @@ class ProcessingPanel:
     def _on_vertical_kernel_size_changed(self, value) -> None:
         """Handle vertical kernel size change"""
         self.app.processing_config.vertical_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_horizontal_kernel_size_changed(self, value) -> None:
         """Handle horizontal kernel size change"""
         self.app.processing_config.horizontal_kernel_size = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_hough_lines_removal_changed(self) -> None:
         """Handle Hough lines removal change"""
         self.app.processing_config.hough_lines_removal = self.hough_lines_removal_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_advanced_morphology_section(self) -> None:
         """Create advanced morphology section"""
@@ -1988,22 +1988,22 @@ class ProcessingPanel:
     def _on_stroke_width_normalization_changed(self) -> None:
         """Handle stroke width normalization change"""
         self.app.processing_config.stroke_width_normalization = self.stroke_width_normalization_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_tophat_changed(self) -> None:
         """Handle tophat change"""
         self.app.processing_config.tophat = self.tophat_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_blackhat_changed(self) -> None:
         """Handle blackhat change"""
         self.app.processing_config.blackhat = self.blackhat_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_gradient_changed(self) -> None:
         """Handle gradient change"""
         self.app.processing_config.gradient = self.gradient_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_character_operations_section(self) -> None:
         """Create character operations section"""
@@ -2037,17 +2037,17 @@ class ProcessingPanel:
     def _on_character_dilation_changed(self) -> None:
         """Handle character dilation change"""
         self.app.processing_config.character_dilation = self.character_dilation_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_character_erosion_changed(self) -> None:
         """Handle character erosion change"""
         self.app.processing_config.character_erosion = self.character_erosion_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_min_contour_area_changed(self, value) -> None:
         """Handle min contour area change"""
         self.app.processing_config.min_contour_area = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_contour_filtering_section(self) -> None:
         """Create contour filtering section"""
@@ -2078,22 +2078,22 @@ class ProcessingPanel:
     def _on_contour_filtering_changed(self) -> None:
         """Handle contour filtering change"""
         self.app.processing_config.contour_filtering = self.contour_filtering_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_connected_components_filtering_changed(self) -> None:
         """Handle connected components filtering change"""
         self.app.processing_config.connected_components_filtering = self.connected_components_filtering_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_aspect_ratio_filtering_changed(self) -> None:
         """Handle aspect ratio filtering change"""
         self.app.processing_config.aspect_ratio_filtering = self.aspect_ratio_filtering_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_lbp_radius_changed(self, value) -> None:
         """Handle LBP radius change"""
         self.app.processing_config.lbp_radius = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _create_advanced_operations_section(self) -> None:
         """Create consolidated advanced operations section"""
@@ -2238,82 +2238,82 @@ class ProcessingPanel:
     def _on_contour_area_min_changed(self, value) -> None:
         """Handle contour area min change"""
         self.app.processing_config.contour_area_min = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_contour_area_max_changed(self, value) -> None:
         """Handle contour area max change"""
         self.app.processing_config.contour_area_max = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_distance_transform_type_changed(self, value) -> None:
         """Handle distance transform type change"""
         self.app.processing_config.distance_transform_type = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_lbp_n_points_changed(self, value) -> None:
         """Handle LBP N points change"""
         self.app.processing_config.lbp_n_points = int(float(value))
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_distance_transform_changed(self) -> None:
         """Handle distance transform change"""
         self.app.processing_config.distance_transform = self.distance_transform_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_skeletonize_changed(self) -> None:
         """Handle skeletonize change"""
         self.app.processing_config.skeletonize = self.skeletonize_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_watershed_markers_changed(self) -> None:
         """Handle watershed markers change"""
         self.app.processing_config.watershed_markers = self.watershed_markers_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_edge_enhancement_changed(self) -> None:
         """Handle edge enhancement change"""
         self.app.processing_config.edge_enhancement = self.edge_enhancement_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_histogram_eq_changed(self) -> None:
         """Handle histogram equalization change"""
         self.app.processing_config.histogram_equalization = self.histogram_equalization_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_character_separation_changed(self) -> None:
         """Handle character separation change"""
         self.app.processing_config.character_separation = self.character_separation_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_vertical_line_removal_changed(self) -> None:
         """Handle vertical line removal change"""
         self.app.processing_config.vertical_line_removal = self.vertical_line_removal_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_horizontal_line_removal_changed(self) -> None:
         """Handle horizontal line removal change"""
         self.app.processing_config.horizontal_line_removal = self.horizontal_line_removal_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_noise_dots_removal_changed(self) -> None:
         """Handle noise dots removal change"""
         self.app.processing_config.noise_dots_removal = self.noise_dots_removal_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_adaptive_hist_eq_changed(self) -> None:
         """Handle adaptive histogram equalization change"""
         self.app.processing_config.adaptive_hist_eq = self.adaptive_hist_eq_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_multi_otsu_changed(self) -> None:
         """Handle multi-OTSU change"""
         self.app.processing_config.multi_otsu = self.multi_otsu_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _on_local_binary_pattern_changed(self) -> None:
         """Handle local binary pattern change"""
         self.app.processing_config.local_binary_pattern = self.local_binary_pattern_var.get()
-        self.app.update_image_display()
+        self.app.schedule_image_update()
 
     def _update_resize_dependent_controls(self) -> None:
         """Update state of controls that depend on resize"""
@@ -1,24 +1,54 @@
 import sys
+import threading
+import time
 import tkinter as tk
+from collections.abc import Callable
+from copy import copy, deepcopy
+from functools import partial
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
-import cv2
 import numpy as np
 from PIL import Image, ImageTk
 
 from src.config import CaptureConfig, OCRConfig, ProcessingConfig
 from src.core.capture import capture_image
-from src.core.ocr import OCRProtocol, create_ocr
-from src.core.processing import process_image
+from src.core.ocr import (
+    get_available_ocr_backends,
+    get_ocr_engine_pool,
+    prepare_ocr_image,
+    recognize_text,
+    warm_up_ocr,
+)
+from src.core.ocr_comparison import (
+    EngineComparison,
+    compare_ocr_engines,
+    format_ocr_comparison,
+    fuse_ocr_results,
+)
+from src.core.ocr_result import OCRResult
+from src.core.preview import create_proxy, scale_config
+from src.core.processing import IncrementalProcessor, ProcessingCancelled, process_image
+from src.core.profiling import ProcessingProfile, stop_memory_tracing
 from src.gui.components.capture import CapturePanel
 from src.gui.components.image import ImagePanel
 from src.gui.components.menu import MenuBar
 from src.gui.components.ocr import OCRPanel
 from src.gui.components.processing import ProcessingPanel
 from src.gui.utils import get_padding, show_error, show_success
+from src.gui.worker import BackgroundWorker
+from src.infra.cache import configure_disk_cache, tag_array
 from src.infra.io import load_image, load_image_from_clipboard, load_json, save_image, save_json
 
+PREVIEW_MAX_SCALE: float = 0.75
+PREVIEW_MIN_PIXELS: int = 2_000_000
+PREVIEW_COMMIT_DELAY_MS: int = 400
+UPDATE_DEBOUNCE_MS: int = 33
+OCR_WARM_UP_DELAY_MS: int = 1000
+OCR_ENGINE_SWEEP_MS: int = 60_000
+DISK_CACHE_DIR: Path = Path.home() / ".cache" / "image-lab"
+DISK_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+
 
 def get_icon_path() -> Path | None:
     project_root = Path(__file__).parent.parent.parent
@@ -29,17 +59,51 @@ def get_icon_path() -> Path | None:
 class ImageLabGUI:
     """Main GUI application for Image Lab"""
 
-    def __init__(self, window_width: int = 1000, window_height: int = 600) -> None:
+    def __init__(
+        self,
+        window_width: int = 1000,
+        window_height: int = 600,
+        update_debounce_ms: int = UPDATE_DEBOUNCE_MS,
+        cache_dir: Path = DISK_CACHE_DIR,
+        disk_cache_enabled: bool = False,
+        disk_cache_max_bytes: int = DISK_CACHE_MAX_BYTES,
+        ocr_warm_up_enabled: bool = False,
+    ) -> None:
         self._window_width = window_width
         self._window_height = window_height
+        self.update_debounce_ms = update_debounce_ms
+        self.cache_dir = cache_dir
+        self.disk_cache_max_bytes = disk_cache_max_bytes
+        self.disk_cache_enabled = False
 
         self.current_image: np.ndarray | None = None
         self.processed_image: np.ndarray | None = None
-        self.ocr_instance: OCRProtocol | None = None
+        self.ocr_result: OCRResult | None = None
+        self.image_processor = IncrementalProcessor()
+        self.preview_processor = IncrementalProcessor()
+        self.preview_enabled: bool = True
+        self.processed_scale: float = 1.0
+        self.profiling_enabled: bool = False
+        self.processing_profile: ProcessingProfile | None = None
+        self.ocr_warm_up_enabled: bool = ocr_warm_up_enabled
+
+        self._preview_source: tuple[np.ndarray, float, np.ndarray] | None = None
+        self._full_resolution_job: str | None = None
+        self._image_update_job: str | None = None
+        self._ocr_warm_up_job: str | None = None
+        self._pending_ocr: Callable[[np.ndarray], None] | None = None
+        self._ocr_warming_up = False
+        self._reset_zoom_on_display = False
+        self._processing_lock = threading.Lock()
 
         self._initialize_window()
+        self.set_disk_cache_enabled(disk_cache_enabled)
+        self.processing_worker = BackgroundWorker(self.root, "processing")
+        self.ocr_worker = BackgroundWorker(self.root, "ocr")
         self._initialize_configs()
         self._setup_ui()
+        self.schedule_ocr_warm_up()
+        self.root.after(OCR_ENGINE_SWEEP_MS, self._release_idle_ocr_engines)
 
     def run(self) -> None:
         """Start the application"""
@@ -50,29 +114,59 @@ class ImageLabGUI:
             show_error(f"Application error: {exception}")
 
     def run_ocr(self) -> None:
-        """Run OCR on processed image"""
-        if self.processed_image is None:
-            show_error("No image to process")
+        """Queue OCR of full-resolution result, superseding any run still in flight"""
+        self._run_on_full_resolution(self._submit_ocr)
+
+    def compare_ocr_engines(self) -> None:
+        """Queue OCR of full-resolution result with every installed engine at once and compare them side by side"""
+        engines = get_available_ocr_backends()
+
+        if len(engines) < 2:
+            show_error("Install at least two OCR engines to compare them", "Compare OCR Engines")
             return
 
-        try:
-            if self.ocr_instance is None:
-                self.ocr_instance = create_ocr(self.ocr_config)
+        self._run_on_full_resolution(partial(self._submit_ocr_comparison, engines))
 
-            ocr_image = self._prepare_image_for_ocr(self.processed_image)
-            result = self.ocr_instance.predict(ocr_image)
+    def cancel_ocr(self) -> None:
+        """Discard the OCR run in progress or waiting for the full-resolution result"""
+        cancelled = self._pending_ocr is not None
+        self._pending_ocr = None
 
-            self.ocr_panel.display_results(result)
+        if self.ocr_worker.busy and not self._ocr_warming_up:
+            self.ocr_worker.cancel()
+            cancelled = True
 
-        except Exception as exception:
-            show_error(f"OCR failed: {exception}")
+        if cancelled:
+            self.ocr_panel.set_running(False, "OCR cancelled")
+
+    def add_ocr_region(self, region: tuple[int, int, int, int]) -> None:
+        """Restrict OCR to region of the processed image in addition to existing regions"""
+        self.ocr_config.regions = [*self.ocr_config.regions, region]
+        self._refresh_ocr_regions()
+
+    def use_crop_box_as_ocr_region(self) -> None:
+        """Restrict OCR to the crop bounding box without cropping the image"""
+        bbox = self.processing_config.bbox
+
+        if bbox is None:
+            show_error("No crop bounding box set", "OCR Regions")
+            return
+
+        if self.processing_config.crop_enabled:
+            show_error("Crop is enabled, so OCR already reads only the bounding box", "OCR Regions")
+            return
+
+        self.add_ocr_region(tuple(bbox))
+
+    def clear_ocr_regions(self) -> None:
+        """Run OCR on the whole processed image again"""
+        self.ocr_config.regions = []
+        self._refresh_ocr_regions()
 
     def capture_new_image(self) -> None:
         """Capture new image using current config"""
         try:
-            self.current_image = capture_image(self.capture_config)
-            self.update_image_display()
-            self.image_panel.reset_zoom()
+            self._set_current_image(capture_image(self.capture_config))
 
         except Exception as exception:
             show_error(f"Capture failed: {exception}")
@@ -95,9 +189,7 @@ class ImageLabGUI:
             image = load_image(filename)
 
             if image is not None:
-                self.current_image = image
-                self.update_image_display()
-                self.image_panel.reset_zoom()
+                self._set_current_image(image)
             else:
                 show_error("Failed to load image")
 
@@ -110,9 +202,7 @@ class ImageLabGUI:
             image = load_image_from_clipboard()
 
             if image is not None:
-                self.current_image = image
-                self.update_image_display()
-                self.image_panel.reset_zoom()
+                self._set_current_image(image)
             else:
                 show_error("No image found in clipboard")
 
@@ -121,6 +211,8 @@ class ImageLabGUI:
 
     def save_image_file(self, filename: str | None = None) -> None:
         """Save processed image to file"""
+        self.commit_full_resolution(wait=True)
+
         if self.processed_image is None:
             show_error("No image to save")
             return
@@ -200,7 +292,7 @@ class ImageLabGUI:
                         self.processing_config.update_from_dict(config_data)
 
             self._refresh_panels()
-            self.ocr_instance = None
+            self.schedule_ocr_warm_up()
             show_success("Configuration loaded")
 
         except Exception as exception:
@@ -214,28 +306,412 @@ class ImageLabGUI:
             self.processing_config = ProcessingConfig()
 
             self._refresh_panels()
-            self.ocr_instance = None
+            self.schedule_ocr_warm_up()
             show_success("Configurations reset to defaults")
 
+    def set_ocr_warm_up_enabled(self, enabled: bool) -> None:
+        """Enable or disable loading the configured OCR engine in the background"""
+        self.ocr_warm_up_enabled = enabled
+
+        if enabled:
+            self.schedule_ocr_warm_up()
+        else:
+            self._cancel_ocr_warm_up()
+
+    def schedule_ocr_warm_up(self) -> None:
+        """Warm up the configured OCR engine once OCR settings stop changing"""
+        self._cancel_ocr_warm_up()
+
+        if self.ocr_warm_up_enabled:
+            self._ocr_warm_up_job = self.root.after(OCR_WARM_UP_DELAY_MS, self._warm_up_ocr)
+
+    def schedule_image_update(self) -> None:
+        """Coalesce a burst of config changes into one update per debounce interval"""
+        if self._image_update_job is None:
+            self._image_update_job = self.root.after(self.update_debounce_ms, self.update_image_display)
+
     def update_image_display(self) -> None:
-        """Update image display with current processing"""
+        """Queue reprocessing of current image, superseding any update still in flight"""
+        self._cancel_scheduled_update()
+
+        if self.current_image is None:
+            return
+
+        self._cancel_full_resolution()
+
+        scale = self._get_preview_scale()
+        config = copy(self.processing_config)
+        profile = self._create_profile()
+
+        if scale < 1.0:
+            job = partial(self._process_preview, self.current_image, config, scale, profile=profile)
+        else:
+            job = partial(self._process_full_resolution, self.current_image, config, profile=profile)
+
+        self.processing_worker.submit(
+            job,
+            partial(self._on_processing_done, scale=scale, profile=profile),
+            self._on_processing_failed,
+        )
+
+    def commit_full_resolution(self, wait: bool = False) -> None:
+        """Replace a low-resolution preview with the full-resolution result"""
+        self._cancel_full_resolution()
+
         if self.current_image is None:
             return
 
+        if not wait:
+            if self.processed_scale < 1.0 and not self.processing_worker.busy:
+                config = copy(self.processing_config)
+                profile = self._create_profile()
+                job = partial(self._process_full_resolution, self.current_image, config, profile=profile)
+                on_done = partial(self._on_processing_done, profile=profile)
+                self.processing_worker.submit(job, on_done, self._on_processing_failed)
+            return
+
+        if self.processed_scale == 1.0 and not self.processing_worker.busy and self._image_update_job is None:
+            return
+
+        self._cancel_scheduled_update()
+        self.processing_worker.cancel()
+
         try:
-            self.processed_image = process_image(self.current_image, self.processing_config)
-            self.image_panel.update_image(self.processed_image)
-            self.processing_panel.sync_controls_from_image()
+            profile = self._create_profile()
+            processed = self._process_full_resolution(self.current_image, copy(self.processing_config), profile=profile)
+            self._show_processed_image(processed, 1.0)
+            self._show_profile(profile)
 
         except Exception as exception:
             show_error(f"Processing failed: {exception}")
 
-    def _prepare_image_for_ocr(self, image: np.ndarray) -> np.ndarray:
-        """Prepare image for OCR processing"""
-        if len(image.shape) == 2:
-            return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    def set_preview_enabled(self, enabled: bool) -> None:
+        """Enable or disable low-resolution preview while tuning"""
+        self.preview_enabled = enabled
+
+        if not enabled:
+            self.commit_full_resolution()
+
+    def set_profiling_enabled(self, enabled: bool) -> None:
+        """Enable or disable per-operation timing and memory profiling"""
+        self.profiling_enabled = enabled
+
+        if enabled:
+            self.update_image_display()
+        else:
+            stop_memory_tracing()
+            self._show_profile(None)
+
+    def set_disk_cache_enabled(self, enabled: bool) -> None:
+        """Enable or disable keeping processing and OCR results on disk between sessions"""
+        disk_cache = configure_disk_cache(self.cache_dir if enabled else None, self.disk_cache_max_bytes)
+        self.disk_cache_enabled = disk_cache is not None
+
+        if enabled and disk_cache is None:
+            show_error(f"Cannot use cache directory: {self.cache_dir}", "Persistent Cache")
+
+    def set_disk_cache_max_bytes(self, max_bytes: int) -> None:
+        """Limit size of the persistent cache, evicting old results beyond it"""
+        self.disk_cache_max_bytes = max_bytes
+
+        if self.disk_cache_enabled:
+            self.set_disk_cache_enabled(True)
+
+    def show_processing_report(self) -> None:
+        """Show timing and memory of every operation in the last processing run"""
+        if self.processing_profile is None:
+            show_error("No profile recorded yet. Enable View > Profile Processing first.", "Processing Report")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Processing Report")
+
+        text = tk.Text(window, font="TkFixedFont", wrap=tk.NONE, width=110, height=30)
+        text.insert(tk.END, self.processing_profile.format())
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True)
+
+    def _set_current_image(self, image: np.ndarray) -> None:
+        """Replace current image and fit it to the window once processed"""
+        tag_array(image)
+        self.cancel_ocr()
+        self.current_image = image
+        self._reset_zoom_on_display = True
+        self.update_image_display()
+
+    def _process_full_resolution(
+        self,
+        image: np.ndarray,
+        config: ProcessingConfig,
+        cancelled: Callable[[], bool] | None = None,
+        profile: ProcessingProfile | None = None,
+    ) -> np.ndarray:
+        """Process image at full resolution, reusing results kept by the processing cache"""
+        with self._processing_lock:
+            cache_key = process_image.cache_key(image, config, None)
+            processed = process_image.lookup(cache_key) if profile is None else None
+
+            if processed is None:
+                processed = self.image_processor.process(image, config, cancelled, profile)
+                processed = process_image.store(cache_key, processed)
+
+            return processed
+
+    def _process_preview(
+        self,
+        image: np.ndarray,
+        config: ProcessingConfig,
+        scale: float,
+        cancelled: Callable[[], bool] | None = None,
+        profile: ProcessingProfile | None = None,
+    ) -> np.ndarray:
+        """Process downscaled proxy of image with config scaled to match"""
+        with self._processing_lock:
+            proxy = self._get_preview_source(image, scale)
+            return self.preview_processor.process(proxy, scale_config(config, scale), cancelled, profile)
+
+    def _on_processing_done(
+        self,
+        processed: np.ndarray,
+        scale: float = 1.0,
+        profile: ProcessingProfile | None = None,
+    ) -> None:
+        """Display result delivered by the processing worker"""
+        self._show_processed_image(processed, scale)
+        self._show_profile(profile)
+
+        if scale < 1.0:
+            self._schedule_full_resolution()
+        elif self._pending_ocr is not None:
+            action, self._pending_ocr = self._pending_ocr, None
+            action(processed)
+
+    def _run_on_full_resolution(self, action: Callable[[np.ndarray], None]) -> None:
+        """Run OCR action on full-resolution result, processing it on the worker first if only a preview is shown"""
+        if self.current_image is None:
+            show_error("No image to process")
+            return
+
+        self._cancel_full_resolution()
+
+        ready = self.processed_image is not None and self.processed_scale == 1.0
+
+        if ready and not self.processing_worker.busy and self._image_update_job is None:
+            action(self.processed_image)
+            return
+
+        self.cancel_ocr()
+        self._cancel_scheduled_update()
+        self._pending_ocr = action
+
+        # The next full-resolution result starts the OCR run, so the interface stays responsive meanwhile
+        config = copy(self.processing_config)
+        profile = self._create_profile()
+        job = partial(self._process_full_resolution, self.current_image, config, profile=profile)
+        on_done = partial(self._on_processing_done, profile=profile)
+
+        self.processing_worker.submit(job, on_done, self._on_processing_failed)
+        self.ocr_panel.set_running(True, "Processing full resolution...")
+
+    def _submit_ocr(self, image: np.ndarray) -> None:
+        """Queue OCR of processed image on the OCR worker"""
+        config = deepcopy(self.ocr_config)
+        job = partial(self._recognize_text, image, config)
+
+        self._cancel_ocr_warm_up()
+        self._ocr_warming_up = False
+        self.ocr_worker.submit(job, self._on_ocr_done, self._on_ocr_failed)
+        self.ocr_panel.set_running(True, f"Running {config.ocr_type}...")
+
+    def _submit_ocr_comparison(self, engines: list[str], image: np.ndarray) -> None:
+        """Queue OCR of processed image with all engines on the OCR worker"""
+        job = partial(self._compare_ocr_engines, image, engines, deepcopy(self.ocr_config))
+
+        self._cancel_ocr_warm_up()
+        self._ocr_warming_up = False
+        self.ocr_worker.submit(job, self._on_ocr_comparison_done, self._on_ocr_failed)
+        self.ocr_panel.set_running(True, f"Comparing {len(engines)} engines...")
+
+    def _recognize_text(
+        self,
+        image: np.ndarray,
+        config: OCRConfig,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[OCRResult | None, float]:
+        """Load OCR engine if needed and recognize text, returning result and elapsed seconds"""
+        start = time.perf_counter()
+        ocr_image = prepare_ocr_image(image)
+
+        if cancelled is not None and cancelled():
+            return None, 0.0
+
+        return recognize_text(ocr_image, config), time.perf_counter() - start
+
+    def _on_ocr_done(self, outcome: tuple[OCRResult, float]) -> None:
+        """Display result delivered by the OCR worker"""
+        result, seconds = outcome
+        self.ocr_result = result
+        self.ocr_panel.display_results(result)
+        self.ocr_panel.set_running(False, f"Done in {seconds:.2f} s")
+
+    def _compare_ocr_engines(
+        self,
+        image: np.ndarray,
+        engines: list[str],
+        config: OCRConfig,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> tuple[list[EngineComparison], OCRResult, float] | None:
+        """Run all engines concurrently, returning their comparisons, fused result and elapsed seconds"""
+        start = time.perf_counter()
+        ocr_image = prepare_ocr_image(image)
+
+        if cancelled is not None and cancelled():
+            return None
+
+        comparisons = compare_ocr_engines(ocr_image, engines, config)
+        fused = fuse_ocr_results([comparison.result for comparison in comparisons if comparison.result is not None])
+
+        return comparisons, fused, time.perf_counter() - start
+
+    def _on_ocr_comparison_done(self, outcome: tuple[list[EngineComparison], OCRResult, float]) -> None:
+        """Display fused result and open report comparing the engines"""
+        comparisons, fused, seconds = outcome
+        self.ocr_result = fused
+        self.ocr_panel.display_results(fused)
+        self.ocr_panel.set_running(False, f"Compared {len(comparisons)} engines in {seconds:.2f} s")
+
+        window = tk.Toplevel(self.root)
+        window.title("OCR Engine Comparison")
+
+        text = tk.Text(window, font="TkFixedFont", wrap=tk.NONE, width=130, height=30)
+        text.insert(tk.END, format_ocr_comparison(comparisons, fused))
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True)
+
+    def _on_ocr_failed(self, exception: Exception) -> None:
+        """Report failure delivered by the OCR worker"""
+        self.ocr_panel.set_running(False, "OCR failed")
+        show_error(f"OCR failed: {exception}")
+
+    def _refresh_ocr_regions(self) -> None:
+        """Show OCR regions in the OCR panel and on the image"""
+        self.ocr_panel.update_regions()
+        self.image_panel.draw_ocr_regions()
+
+    def _warm_up_ocr(self) -> None:
+        """Load OCR engine and run a dummy inference unless an OCR run is already loading it"""
+        self._ocr_warm_up_job = None
+
+        if self.ocr_worker.busy:
+            return
+
+        config = deepcopy(self.ocr_config)
+        self._ocr_warming_up = True
+        self.ocr_worker.submit(
+            partial(self._load_ocr_engine, config),
+            self._on_ocr_warmed_up,
+            self._on_ocr_warm_up_failed,
+        )
+        self.ocr_panel.set_running(False, f"Warming up {config.ocr_type}...")
+
+    def _load_ocr_engine(self, config: OCRConfig, cancelled: Callable[[], bool] | None = None) -> tuple[str, float]:
+        """Create OCR engine and initialize it with a dummy inference, returning engine name and elapsed seconds"""
+        start = time.perf_counter()
+        warm_up_ocr(config)
+        return config.ocr_type, time.perf_counter() - start
+
+    def _on_ocr_warmed_up(self, outcome: tuple[str, float]) -> None:
+        """Report OCR engine ready for use"""
+        ocr_type, seconds = outcome
+        self._ocr_warming_up = False
+        self.ocr_panel.set_running(False, f"{ocr_type} ready (loaded in {seconds:.2f} s)")
+
+    def _on_ocr_warm_up_failed(self, exception: Exception) -> None:
+        """Report warm-up failure without interrupting the user"""
+        self._ocr_warming_up = False
+        self.ocr_panel.set_running(False, f"Warm-up failed: {exception}")
+
+    def _release_idle_ocr_engines(self) -> None:
+        """Free OCR engines that have not been used for a while"""
+        get_ocr_engine_pool().release_idle()
+        self.root.after(OCR_ENGINE_SWEEP_MS, self._release_idle_ocr_engines)
+
+    def _cancel_ocr_warm_up(self) -> None:
+        """Cancel scheduled OCR warm-up"""
+        if self._ocr_warm_up_job is not None:
+            self.root.after_cancel(self._ocr_warm_up_job)
+            self._ocr_warm_up_job = None
+
+    def _on_processing_failed(self, exception: Exception) -> None:
+        """Report failure delivered by the processing worker"""
+        if not isinstance(exception, ProcessingCancelled):
+            if self._pending_ocr is not None:
+                self._pending_ocr = None
+                self.ocr_panel.set_running(False, "OCR failed")
+
+            show_error(f"Processing failed: {exception}")
+
+    def _show_processed_image(self, image: np.ndarray, scale: float) -> None:
+        """Store processed image and push it to the display"""
+        self.processed_image = image
+        self.processed_scale = scale
+        self.image_panel.update_image(image, scale)
+        self.processing_panel.sync_controls_from_image()
+
+        if self._reset_zoom_on_display:
+            self._reset_zoom_on_display = False
+            self.image_panel.reset_zoom()
+
+    def _create_profile(self) -> ProcessingProfile | None:
+        """Create profile for the next processing run if profiling is enabled"""
+        return ProcessingProfile(trace_memory=True) if self.profiling_enabled else None
+
+    def _show_profile(self, profile: ProcessingProfile | None) -> None:
+        """Store profile of the displayed result and summarize it next to the image info"""
+        self.processing_profile = profile
+        self.image_panel.update_profile(profile)
+
+    def _get_preview_scale(self) -> float:
+        """Get proxy scale matching the displayed resolution, or 1.0 to process at full resolution"""
+        if not self.preview_enabled or self.current_image is None:
+            return 1.0
+
+        h, w = self.current_image.shape[:2]
+
+        if h * w < PREVIEW_MIN_PIXELS:
+            return 1.0
+
+        scale = self.image_panel.zoom_factor
+        return scale if scale <= PREVIEW_MAX_SCALE else 1.0
+
+    def _get_preview_source(self, image: np.ndarray, scale: float) -> np.ndarray:
+        """Get downscaled proxy of image, reusing the last one when possible"""
+        if self._preview_source is not None:
+            source, source_scale, proxy = self._preview_source
+
+            if source is image and source_scale == scale:
+                return proxy
+
+        proxy = create_proxy(image, scale)
+        self._preview_source = (image, scale, proxy)
+        return proxy
+
+    def _schedule_full_resolution(self) -> None:
+        """Run the full-resolution pass once interaction pauses"""
+        self._cancel_full_resolution()
+        self._full_resolution_job = self.root.after(PREVIEW_COMMIT_DELAY_MS, self.commit_full_resolution)
+
+    def _cancel_scheduled_update(self) -> None:
+        """Cancel pending debounced update"""
+        if self._image_update_job is not None:
+            self.root.after_cancel(self._image_update_job)
+            self._image_update_job = None
 
-        return image
+    def _cancel_full_resolution(self) -> None:
+        """Cancel pending full-resolution pass"""
+        if self._full_resolution_job is not None:
+            self.root.after_cancel(self._full_resolution_job)
+            self._full_resolution_job = None
 
     def _refresh_panels(self) -> None:
         """Refresh all panels with current configurations"""
@@ -0,0 +1,95 @@
+import queue
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from typing import Any
+
+Job = Callable[[Callable[[], bool]], Any]
+
+
+class BackgroundWorker:
+    """Runs jobs on a background thread and delivers only the latest result on the Tk event loop"""
+
+    def __init__(self, root: tk.Misc, name: str = "worker", poll_interval_ms: int = 15) -> None:
+        self._root = root
+        self._poll_interval_ms = poll_interval_ms
+
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._pending: tuple[int, Job, Callable[[Any], None], Callable[[Exception], None] | None] | None = None
+        self._results: queue.SimpleQueue = queue.SimpleQueue()
+        self._busy = False
+        self._polling = False
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """Whether the latest submitted job has not delivered its result yet"""
+        return self._busy
+
+    def submit(
+        self,
+        job: Job,
+        on_success: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> int:
+        """Queue job, superseding any job that has not delivered its result yet"""
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, job, on_success, on_error)
+            self._busy = True
+            self._condition.notify()
+
+        self._start_polling()
+        return self._generation
+
+    def cancel(self) -> None:
+        """Drop the pending job and ignore the result of the running one"""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._busy = False
+
+    def _run(self) -> None:
+        """Execute pending jobs one at a time"""
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+
+                generation, job, on_success, on_error = self._pending
+                self._pending = None
+
+            def is_cancelled(generation: int = generation) -> bool:
+                return generation != self._generation
+
+            try:
+                self._results.put((generation, on_success, job(is_cancelled)))
+            except Exception as exception:
+                self._results.put((generation, on_error, exception))
+
+    def _start_polling(self) -> None:
+        """Start polling for results on the Tk event loop"""
+        if not self._polling:
+            self._polling = True
+            self._root.after(self._poll_interval_ms, self._poll)
+
+    def _poll(self) -> None:
+        """Deliver the result of the latest job and keep polling while it is outstanding"""
+        while not self._results.empty():
+            generation, callback, value = self._results.get_nowait()
+
+            if generation != self._generation:
+                continue
+
+            self._busy = False
+
+            if callback is not None:
+                callback(value)
+
+        if self._busy:
+            self._root.after(self._poll_interval_ms, self._poll)
+        else:
+            self._polling = False
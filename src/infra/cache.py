@@ -1,63 +1,350 @@
 import hashlib
+import os
 import pickle
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import wraps
+from pathlib import Path
 from typing import Any, TypeVar
 
 import numpy as np
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_MISSING = object()
 
-def _create_cache_decorator(max_size: int, copy_arrays: bool) -> Callable[[F], F]:
-    cache: dict[str, Any] = {}
+# Bump when cached function outputs change so stale disk entries are never read
+DISK_CACHE_VERSION = 2
+
+_tagged_arrays: dict[int, tuple[weakref.ref, str]] = {}
+_tagged_arrays_lock = threading.Lock()
+
+_disk_cache: "DiskCache | None" = None
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+class LRUCache:
+    def __init__(self, max_size: int | None = None, max_bytes: int | None = None) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        nbytes = _estimate_nbytes(value)
+
+        with self._lock:
+            self._remove(key)
+
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+            while self._entries and self._over_budget():
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _over_budget(self) -> bool:
+        if self.max_size is not None and len(self._entries) > self.max_size:
+            return True
+
+        return self.max_bytes is not None and self._nbytes > self.max_bytes
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        self._nbytes -= entry[1]
+        return True
+
+
+class DiskCache:
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        paths = sorted(self.directory.glob("*.pkl"), key=lambda path: path.stat().st_mtime)
+        self._sizes: OrderedDict[str, int] = OrderedDict((path.name, path.stat().st_size) for path in paths)
+        self._nbytes = sum(self._sizes.values())
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._evict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+
+        with self._lock:
+            if path.name not in self._sizes:
+                self._misses += 1
+                return default
+
+            self._sizes.move_to_end(path.name)
+
+        try:
+            value = pickle.loads(path.read_bytes())
+            os.utime(path)
+
+        except Exception:
+            with self._lock:
+                self._misses += 1
+                self._discard(path.name)
+            return default
+
+        with self._lock:
+            self._hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._nbytes -= self._sizes.pop(path.name, 0)
+            self._sizes[path.name] = len(data)
+            self._nbytes += len(data)
+            self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        name = self._path(key).name
+
+        with self._lock:
+            if name not in self._sizes:
+                return False
+
+            self._discard(name)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._sizes):
+                self._discard(name)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._sizes), self._nbytes)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.blake2b(f"{DISK_CACHE_VERSION}:{key}".encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}.pkl"
+
+    def _evict(self) -> None:
+        while self._sizes and self._nbytes > self.max_bytes:
+            self._discard(next(iter(self._sizes)))
+            self._evictions += 1
+
+    def _discard(self, name: str) -> None:
+        self._nbytes -= self._sizes.pop(name, 0)
+
+        try:
+            (self.directory / name).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def configure_disk_cache(directory: str | Path | None, max_bytes: int = 2 * 1024 * 1024 * 1024) -> DiskCache | None:
+    global _disk_cache
+
+    try:
+        _disk_cache = DiskCache(directory, max_bytes) if directory is not None else None
+    except OSError:
+        _disk_cache = None
+
+    return _disk_cache
+
+
+def _create_cache_decorator(
+    max_size: int | None,
+    max_bytes: int | None,
+    copy_arrays: bool,
+    read_only: bool = False,
+    persistent: bool = False,
+    key_args: Callable[..., tuple] | None = None,
+) -> Callable[[F], F]:
+    cache = LRUCache(max_size, max_bytes)
 
     def decorator(func: F) -> F:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_key = f"{func.__name__}_{_generate_cache_key(*args, **kwargs)}"
+        def make_key(*args, **kwargs) -> str:
+            # key_args maps the call to the values that determine its result, dropping irrelevant settings
+            if key_args is not None:
+                args, kwargs = key_args(*args, **kwargs), {}
 
-            if cache_key in cache:
-                cached_result = cache[cache_key]
+            return f"{func.__name__}_{_generate_cache_key(*args, **kwargs)}"
 
+        def remember(cache_key: str, result: Any) -> Any:
+            if read_only and isinstance(result, np.ndarray):
+                tag_array(result)
+                cache.put(cache_key, result)
+            elif copy_arrays and isinstance(result, np.ndarray):
+                cache.put(cache_key, result.copy())
+            else:
+                cache.put(cache_key, result)
+
+            return result
+
+        def lookup(cache_key: str, default: Any = None) -> Any:
+            cached_result = cache.get(cache_key, _MISSING)
+
+            if cached_result is not _MISSING:
                 if copy_arrays and isinstance(cached_result, np.ndarray):
                     return cached_result.copy()
 
                 return cached_result
 
-            result = func(*args, **kwargs)
+            disk_cache = _disk_cache if persistent else None
+            result = disk_cache.get(cache_key, _MISSING) if disk_cache is not None else _MISSING
 
-            if len(cache) >= max_size:
-                oldest_key = next(iter(cache))
-                del cache[oldest_key]
+            return default if result is _MISSING else remember(cache_key, result)
 
-            if copy_arrays and isinstance(result, np.ndarray):
-                cache[cache_key] = result.copy()
-            else:
-                cache[cache_key] = result
+        def store(cache_key: str, result: Any) -> Any:
+            if persistent and _disk_cache is not None:
+                _disk_cache.put(cache_key, result)
+
+            return remember(cache_key, result)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            result = lookup(cache_key, _MISSING)
+
+            if result is _MISSING:
+                result = store(cache_key, func(*args, **kwargs))
 
             return result
 
+        def invalidate(*args, **kwargs) -> bool:
+            cache_key = make_key(*args, **kwargs)
+            removed = cache.invalidate(cache_key)
+
+            if persistent and _disk_cache is not None:
+                removed = _disk_cache.invalidate(cache_key) or removed
+
+            return removed
+
+        # Callers that produce results elsewhere, such as worker processes, look up and store them by key
+        wrapper.cache_key = make_key  # type: ignore
+        wrapper.lookup = lookup  # type: ignore
+        wrapper.store = store  # type: ignore
+        wrapper.cache = cache  # type: ignore
+        wrapper.invalidate = invalidate  # type: ignore
+
         return wrapper  # type: ignore
 
     return decorator
 
 
-def image_cache(max_size: int = 64) -> Callable[[F], F]:
-    return _create_cache_decorator(max_size, copy_arrays=True)
+def image_cache(
+    max_size: int | None = 64,
+    max_bytes: int | None = 512 * 1024 * 1024,
+    read_only: bool = False,
+    persistent: bool = False,
+) -> Callable[[F], F]:
+    return _create_cache_decorator(max_size, max_bytes, not read_only, read_only, persistent)
+
+
+def ocr_cache(
+    max_size: int | None = 32,
+    max_bytes: int | None = None,
+    persistent: bool = False,
+    key_args: Callable[..., tuple] | None = None,
+) -> Callable[[F], F]:
+    return _create_cache_decorator(max_size, max_bytes, copy_arrays=False, persistent=persistent, key_args=key_args)
 
 
-def ocr_cache(max_size: int = 32) -> Callable[[F], F]:
-    return _create_cache_decorator(max_size, copy_arrays=False)
+def _estimate_nbytes(value: Any) -> int:
+    if isinstance(getattr(value, "nbytes", None), int):
+        return value.nbytes
+
+    if isinstance(value, list | tuple):
+        return sum(_estimate_nbytes(item) for item in value)
+
+    if isinstance(value, dict):
+        return sum(_estimate_nbytes(item) for item in value.values())
+
+    return 0
 
 
 def _generate_cache_key(*args, **kwargs) -> str:
     def _process_value(value: Any, prefix: str = "") -> str:
         if isinstance(value, np.ndarray):
-            return f"{prefix}arr_{_hash_array(value)}"
+            return f"{prefix}arr_{fingerprint_array(value)}"
         if hasattr(value, "__dict__"):
             return f"{prefix}cfg_{_hash_config(value)}"
-        return f"{prefix}{hash(str(value))}"
+        return f"{prefix}{_hash_text(repr(value))}"
 
     key_parts = [_process_value(arg) for arg in args]
     key_parts.extend(_process_value(v, f"{k}_") for k, v in sorted(kwargs.items()))
@@ -65,14 +352,55 @@ def _generate_cache_key(*args, **kwargs) -> str:
     return "_".join(key_parts)
 
 
+def tag_array(array: np.ndarray) -> str:
+    array.flags.writeable = False
+    fingerprint = _hash_array(array)
+
+    if array.flags.owndata:
+        key = id(array)
+
+        def _forget(ref: weakref.ref) -> None:
+            with _tagged_arrays_lock:
+                if key in _tagged_arrays and _tagged_arrays[key][0] is ref:
+                    del _tagged_arrays[key]
+
+        with _tagged_arrays_lock:
+            _tagged_arrays[key] = (weakref.ref(array, _forget), fingerprint)
+
+    return fingerprint
+
+
+def fingerprint_array(array: np.ndarray) -> str:
+    with _tagged_arrays_lock:
+        entry = _tagged_arrays.get(id(array))
+
+    # A tagged array is read-only and owns its buffer, so its content cannot have changed since tagging
+    if entry is not None and entry[0]() is array and not array.flags.writeable:
+        return entry[1]
+
+    return _hash_array(array)
+
+
 def _hash_array(array: np.ndarray) -> str:
-    return hashlib.sha256(array.tobytes()).hexdigest()[:16]
+    buffer = memoryview(np.ascontiguousarray(array)).cast("B")
+    # SHA-256 runs on the CPU's SHA extensions, so it beats blake2b over large buffers while its 256 bits
+    # keep same-shape images from colliding
+    digest = hashlib.sha256(buffer).hexdigest()
+
+    return f"{array.dtype.name}_{'x'.join(map(str, array.shape))}_{digest}"
 
 
 def _hash_config(config: Any) -> str:
+    if hasattr(config, "fingerprint"):
+        return config.fingerprint()
+
     try:
         config_bytes = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
-        return hashlib.sha256(config_bytes).hexdigest()[:16]
+        return hashlib.blake2b(config_bytes, digest_size=8).hexdigest()
 
     except Exception:
-        return str(hash(str(config)))
+        return _hash_text(repr(config))
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()